@@ -0,0 +1,188 @@
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from explore import explore, load_maze
+from maze_generator import MazeGenerator, ALGORITHMS, DEFAULT_ALGORITHM
+from metrics import record_row
+from wall_grid import WallGrid
+
+FIELDS = ["job", "rows", "cols", "density", "seed", "start", "start_x", "start_y",
+          "steps", "turns", "area", "avg_visits", "time", "visits", "cells", "coverage",
+          "total_visits", "revisit_ratio", "steps_per_cell", "turns_per_cell", "curves", "algorithm"]
+
+def start_position(name, rows, cols, seed):
+    if name == "center":
+        return (cols // 2, rows // 2)
+    if name == "corner":
+        return (0, 0)
+    if name == "random":
+        rng = random.Random(f"start-{seed}")
+        return (rng.randrange(cols), rng.randrange(rows))
+    raise ValueError(f"unknown start position: {name}")
+
+def make_jobs(sizes, densities, seeds, starts, mazes=(), algorithm=DEFAULT_ALGORITHM):
+    jobs = []
+    for name, data in mazes:
+        grid = WallGrid.from_bytes(data)
+        rows, cols = grid.rows, grid.cols
+        for seed in seeds:
+            for start in starts:
+                jobs.append((f"{name}-s{seed}-{start}", rows, cols, None, None, seed, start, data))
+    suffix = "" if algorithm == DEFAULT_ALGORITHM else f"-{algorithm}"
+    for rows, cols in sizes:
+        for density in densities:
+            for seed in seeds:
+                for start in starts:
+                    jobs.append((f"{rows}x{cols}-d{density}-s{seed}-{start}{suffix}",
+                                 rows, cols, density, algorithm, seed, start, None))
+    return jobs
+
+def run_job(job):
+    job_id, rows, cols, density, algorithm, seed, start, data = job
+    if data is None:
+        generator = MazeGenerator(rows, cols, density / 100, rng=random.Random(seed))
+        walls = generator.generate(algorithm)
+    else:
+        walls = WallGrid.from_bytes(data)
+    x, y = start_position(start, rows, cols, seed)
+    result = explore(walls, rows, cols, (x, y), 'NORTH', seed)
+    result.update(job=job_id, rows=rows, cols=cols, density=density, algorithm=algorithm, seed=seed,
+                  start=start, start_x=x, start_y=y)
+    return result
+
+def run_chunk(jobs):
+    return [run_job(job) for job in jobs]
+
+class ResultSink:
+    def __init__(self, filename):
+        self.filename = filename
+        self.is_csv = filename.endswith(".csv")
+        self.fields = FIELDS
+        if self.is_csv:
+            self.drop_torn_row()
+        self.done = self.read_done()
+        new_file = not os.path.exists(filename) or os.path.getsize(filename) == 0
+        self.file = open(filename, "a", newline="", encoding="utf-8")
+        if not new_file and not self.ends_with_newline():
+            self.file.write("\n")
+        if self.is_csv:
+            self.writer = csv.DictWriter(self.file, fieldnames=self.fields, extrasaction="ignore")
+            if new_file:
+                self.writer.writeheader()
+
+    def ends_with_newline(self):
+        with open(self.filename, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def drop_torn_row(self):
+        # A CSV row cut inside a quoted field still parses, and would swallow
+        # the rows appended after it, so everything past the last newline is
+        # cut off and that job runs again.
+        if not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0 or self.ends_with_newline():
+            return
+        with open(self.filename, "r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            while end > 0:
+                start = max(0, end - 65536)
+                f.seek(start)
+                cut = f.read(end - start).rfind(b"\n")
+                if cut >= 0:
+                    f.truncate(start + cut + 1)
+                    return
+                end = start
+            f.truncate(0)
+
+    def read_done(self):
+        done = set()
+        if not os.path.exists(self.filename):
+            return done
+        with open(self.filename, "r", newline="", encoding="utf-8") as f:
+            if self.is_csv:
+                # Rows appended to an older file must follow its header,
+                # so columns added since then are left out.
+                reader = csv.DictReader(f)
+                self.fields = reader.fieldnames or FIELDS
+                last = self.fields[-1]
+                for row in reader:
+                    if row.get(last) is not None:
+                        done.add(row["job"])
+            else:
+                for line in f:
+                    try:
+                        done.add(json.loads(line)["job"])
+                    except (ValueError, KeyError):
+                        continue
+        return done
+
+    def write(self, result):
+        if self.is_csv:
+            self.writer.writerow(record_row(result, self.fields))
+        else:
+            self.file.write(json.dumps(result, ensure_ascii=False) + "\n")
+        self.file.flush()
+        self.done.add(result["job"])
+
+    def close(self):
+        self.file.close()
+
+def run_batch(jobs, output, workers=None, chunk_size=8):
+    sink = ResultSink(output)
+    pending_jobs = [job for job in jobs if job[0] not in sink.done]
+    chunks = [pending_jobs[i:i + chunk_size] for i in range(0, len(pending_jobs), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+    finished = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks.reverse()
+            running = set()
+            while chunks or running:
+                while chunks and len(running) < workers * 2:
+                    running.add(executor.submit(run_chunk, chunks.pop()))
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for result in future.result():
+                        sink.write(result)
+                        finished += 1
+    finally:
+        sink.close()
+    return finished
+
+def parse_size(text):
+    rows, _, cols = text.lower().partition("x")
+    return int(rows), int(cols or rows)
+
+def parse_seeds(values):
+    seeds = []
+    for value in values:
+        first, _, last = value.partition("-")
+        seeds.extend(range(int(first), int(last or first) + 1))
+    return seeds
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="batch", description="Пакетный обход множества лабиринтов")
+    parser.add_argument("--sizes", nargs="*", default=[], type=parse_size, help="размеры вида 50x80")
+    parser.add_argument("--densities", nargs="+", default=[100], type=int, help="плотность стен, 0-100")
+    parser.add_argument("--seeds", nargs="+", default=["0"], help="номера или диапазоны вида 0-99")
+    parser.add_argument("--starts", nargs="+", default=["center"], choices=["center", "corner", "random"])
+    parser.add_argument("--algorithm", default=DEFAULT_ALGORITHM, choices=list(ALGORITHMS), help="алгоритм генерации")
+    parser.add_argument("--maze", nargs="*", default=[], help="файлы лабиринтов: .json из интерфейса или .maze")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--chunk", type=int, default=8)
+    parser.add_argument("--out", default="results.jsonl", help="файл результатов .jsonl или .csv")
+    args = parser.parse_args(argv)
+
+    mazes = []
+    for filename in args.maze:
+        walls, _, _, _, _ = load_maze(filename)
+        mazes.append((os.path.splitext(os.path.basename(filename))[0], walls.to_bytes()))
+    jobs = make_jobs(args.sizes, args.densities, parse_seeds(args.seeds), args.starts, mazes, args.algorithm)
+    finished = run_batch(jobs, args.out, args.workers, args.chunk)
+    print(f"Выполнено: {finished} из {len(jobs)}")
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
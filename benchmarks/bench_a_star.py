@@ -0,0 +1,88 @@
+import heapq
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_generator import MazeGenerator
+from maze_solver import MazeSolver
+from wall_grid import WallGrid
+
+def path_list_search(solver, start, targets):
+    start_x, start_y = start
+    heap = []
+    heapq.heappush(heap, (0, 0, start_x, start_y, []))
+    seen = set()
+    target_set = set(targets)
+    while heap:
+        _, cost, x, y, path = heapq.heappop(heap)
+        if (x, y) in target_set:
+            return path + [(x, y)]
+        if (x, y) in seen:
+            continue
+        seen.add((x, y))
+        for nx, ny in solver.known_walls.open_neighbors(x, y):
+            new_cost = cost + 1 + solver.visited.get((nx, ny), 0) * 2
+            heapq.heappush(heap, (new_cost, new_cost, nx, ny, path + [(nx, ny)]))
+    return None
+
+def measure(search):
+    started = time.perf_counter()
+    search()
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    path = search()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return path, elapsed, peak
+
+def main(size=500, density=0.95, seed=1):
+    random.seed(seed)
+    generator = MazeGenerator(size, size, density)
+    generator.generate_maze_kruskal()
+    walls = generator.get_walls()
+    start = (size // 2, size // 2)
+    targets = [(0, 0), (size - 1, size - 1)]
+    visited = {(x, y): 1 for y in range(size) for x in range(size) if (x, y) not in targets}
+    solver = MazeSolver(walls, size, size, start, 'NORTH', visited, start)
+    solver.known_walls = walls.copy()
+
+    old_path, old_time, old_peak = measure(lambda: path_list_search(solver, start, targets))
+    new_path, new_time, new_peak = measure(lambda: solver.a_star_multi_target(start, targets, None))
+    assert old_path == new_path
+
+    print(f"maze {size}x{size}, density {density}, path length {len(new_path)}")
+    print(f"path lists:      {old_time:8.3f} s  peak {old_peak / 2**20:9.1f} MiB")
+    print(f"parent pointers: {new_time:8.3f} s  peak {new_peak / 2**20:9.1f} MiB")
+
+def open_grid(size):
+    # Empty fields tie on almost every relaxation, which is the worst case
+    # for equal-cost tie-breaking.
+    walls = WallGrid(size, size)
+    start = (size // 2, size // 2)
+    solver = MazeSolver(walls, size, size, start, 'NORTH', {start: 1}, start)
+    solver.known_walls = walls
+    return solver, start, [(0, 0)]
+
+def main_open(size=200, largest=800):
+    solver, start, targets = open_grid(size)
+    old_path, old_time, old_peak = measure(lambda: path_list_search(solver, start, targets))
+    new_path, new_time, new_peak = measure(lambda: solver.a_star_multi_target(start, targets, None))
+    assert old_path == new_path
+
+    print(f"open grid {size}x{size}, path length {len(new_path)}")
+    print(f"path lists:      {old_time:8.3f} s  peak {old_peak / 2**20:9.1f} MiB")
+    print(f"parent pointers: {new_time:8.3f} s  peak {new_peak / 2**20:9.1f} MiB")
+    while size < largest:
+        size *= 2
+        solver, start, targets = open_grid(size)
+        started = time.perf_counter()
+        solver.a_star_multi_target(start, targets, None)
+        print(f"open grid {size}x{size}, parent pointers: {time.perf_counter() - started:8.3f} s")
+
+if __name__ == "__main__":
+    main(*(int(arg) if i != 1 else float(arg) for i, arg in enumerate(sys.argv[1:])))
+    main_open()
\ No newline at end of file
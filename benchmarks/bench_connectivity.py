@@ -0,0 +1,73 @@
+import os
+import random
+import sys
+import time
+from array import array
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from connectivity import Connectivity
+from maze_generator import MazeGenerator
+
+def list_bfs(walls, start, end):
+    queue = [(start, [start])]
+    visited = set()
+    while queue:
+        (x, y), path = queue.pop(0)
+        if (x, y) == end:
+            return path
+        if (x, y) in visited:
+            continue
+        visited.add((x, y))
+        for nx, ny in walls.open_neighbors(x, y):
+            if (nx, ny) not in visited:
+                queue.append(((nx, ny), path + [(nx, ny)]))
+    return None
+
+def deque_bfs(walls, start, end):
+    cols = walls.cols
+    start_id = start[1] * cols + start[0]
+    end_id = end[1] * cols + end[0]
+    parent = array('i', [-1]) * (walls.rows * cols)
+    parent[start_id] = start_id
+    frontier = deque([start_id])
+    while frontier:
+        cell = frontier.popleft()
+        if cell == end_id:
+            path = []
+            while cell != start_id:
+                path.append((cell % cols, cell // cols))
+                cell = parent[cell]
+            path.append(start)
+            path.reverse()
+            return path
+        for neighbor in walls.neighbor_ids(cell):
+            if parent[neighbor] < 0:
+                parent[neighbor] = cell
+                frontier.append(neighbor)
+    return None
+
+def main(sizes=(50, 100, 200), density=0.5, queries=20, seed=1):
+    for size in sizes:
+        random.seed(seed)
+        generator = MazeGenerator(size, size, density)
+        generator.generate_maze_kruskal()
+        walls = generator.get_walls()
+        pairs = [((random.randrange(size), random.randrange(size)), (random.randrange(size), random.randrange(size)))
+                 for _ in range(queries)]
+        results = []
+        for name, query in (("list bfs", lambda a, b: list_bfs(walls, a, b) is not None),
+                            ("deque bfs", lambda a, b: deque_bfs(walls, a, b) is not None),
+                            ("index", Connectivity(walls).connected)):
+            if name == "list bfs" and size > 100:
+                continue
+            started = time.perf_counter()
+            answers = [query(a, b) for a, b in pairs]
+            results.append((name, (time.perf_counter() - started) / queries, answers))
+        assert all(answers == results[0][2] for _, _, answers in results)
+        print(f"grid {size}x{size}: " + ", ".join(
+            f"{name} {elapsed * 1000:.2f} ms/query" for name, elapsed, _ in results))
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (50, 100, 200))
\ No newline at end of file
@@ -0,0 +1,35 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_generator import MazeGenerator
+from maze_solver import MazeSolver
+
+def explore(walls, size, planner, seed):
+    random.seed(seed)
+    start = (size // 2, size // 2)
+    solver = MazeSolver(walls, size, size, start, 'NORTH', {start: 1}, start, planner=planner)
+    started = time.perf_counter()
+    steps = 0
+    while solver.get_next_step():
+        steps += 1
+    return solver, steps, time.perf_counter() - started
+
+def main(sizes=(50, 100, 200), densities=(0.5, 0.95), seed=1):
+    for density in densities:
+        for size in sizes:
+            random.seed(seed)
+            generator = MazeGenerator(size, size, density)
+            generator.generate_maze_kruskal()
+            walls = generator.get_walls()
+            print(f"maze {size}x{size}, density {density}")
+            for planner in ('astar', 'dstar'):
+                solver, steps, elapsed = explore(walls, size, planner, seed)
+                print(f"  {planner:6} {steps:8} steps {solver.replans:6} replans "
+                      f"{solver.expansions:10} expansions {elapsed:8.2f} s")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
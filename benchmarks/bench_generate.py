@@ -0,0 +1,30 @@
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_generator import MazeGenerator, ALGORITHMS
+
+def generate(algorithm, size, density, seed):
+    generator = MazeGenerator(size, size, density, rng=random.Random(seed))
+    return generator.generate(algorithm)
+
+def main(sizes=(250, 500, 1000), density=0.5, seed=1, traced=500):
+    for algorithm in ALGORITHMS:
+        for size in sizes:
+            started = time.perf_counter()
+            generate(algorithm, size, density, seed)
+            elapsed = time.perf_counter() - started
+            line = f"{algorithm} {size}x{size}: {elapsed:.2f} s, {elapsed * 1e6 / (size * size):.2f} s per million cells"
+            if size <= traced:
+                tracemalloc.start()
+                generate(algorithm, size, density, seed)
+                line += f", peak {tracemalloc.get_traced_memory()[1] / 1e6:.1f} MB"
+                tracemalloc.stop()
+            print(line)
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (250, 500, 1000))
\ No newline at end of file
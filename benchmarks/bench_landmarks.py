@@ -0,0 +1,41 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from landmarks import Landmarks
+from maze_generator import MazeGenerator
+
+class Manhattan(Landmarks):
+    def estimator(self, start, end):
+        cols = self.walls.cols
+        end_x, end_y = end % cols, end // cols
+        return lambda cell: abs(cell % cols - end_x) + abs(cell // cols - end_y)
+
+def main(size=300, density=0.9, queries=50, seed=1):
+    random.seed(seed)
+    generator = MazeGenerator(size, size, density)
+    generator.generate_maze_kruskal()
+    walls = generator.get_walls()
+    pairs = [((random.randrange(size), random.randrange(size)), (random.randrange(size), random.randrange(size)))
+             for _ in range(queries)]
+    print(f"maze {size}x{size}, density {density}, {queries} queries")
+    for name, index in (("dijkstra", Landmarks(walls, 0)), ("manhattan", Manhattan(walls, 0)),
+                        ("alt 4", Landmarks(walls, 4)), ("alt 8", Landmarks(walls, 8)),
+                        ("alt 16", Landmarks(walls, 16))):
+        started = time.perf_counter()
+        index.build()
+        built = time.perf_counter() - started
+        expansions = 0
+        started = time.perf_counter()
+        for start, end in pairs:
+            index.find_path(start, end)
+            expansions += index.expansions
+        elapsed = time.perf_counter() - started
+        print(f"  {name:10} build {built:6.2f} s  {expansions / queries:10.0f} expansions/query  "
+              f"{elapsed / queries * 1000:8.2f} ms/query")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
\ No newline at end of file
@@ -0,0 +1,34 @@
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cell_state import VisitCounts
+from metrics import summary
+
+def random_visits(size, mean, max_visits):
+    visited = VisitCounts(size, size)
+    for y in range(size):
+        for x in range(size):
+            visited[(x, y)] = 1 + min(max_visits, int(random.expovariate(1 / mean)))
+    return visited
+
+def main(size=1000, seed=1):
+    for mean, max_visits in ((1, 7), (50, 1000)):
+        random.seed(seed)
+        visited = random_visits(size, mean, max_visits)
+        started = time.perf_counter()
+        counter = Counter(visited.values())
+        counter_time = time.perf_counter() - started
+        started = time.perf_counter()
+        result = summary(visited, size, size, 0, 0)
+        summary_time = time.perf_counter() - started
+        assert result["visits"] == dict(sorted(counter.items()))
+        print(f"grid {size}x{size}, up to {max_visits + 1} visits: "
+              f"Counter {counter_time * 1000:.1f} ms, summary {summary_time * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
\ No newline at end of file
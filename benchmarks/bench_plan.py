@@ -0,0 +1,66 @@
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_solver import MazeSolver
+from wall_grid import WallGrid, OFFSETS
+
+def winding_path(length, turn_chance):
+    path = []
+    x = y = 0
+    direction = 1
+    while len(path) < length:
+        if random.random() < turn_chance:
+            direction = random.randrange(4)
+        dx, dy = OFFSETS[direction]
+        x += dx
+        y += dy
+        path.append((x, y))
+    return path
+
+def tuple_plan(solver, move_path):
+    path = []
+    current_x, current_y = solver.current_pos
+    current_dir = solver.current_dir
+    for step_x, step_y in move_path:
+        if step_x > current_x:
+            step_dir = 'EAST'
+        elif step_x < current_x:
+            step_dir = 'WEST'
+        elif step_y > current_y:
+            step_dir = 'SOUTH'
+        else:
+            step_dir = 'NORTH'
+        for turn in solver.get_required_turns(current_dir, step_dir):
+            path.append((current_x, current_y, turn))
+            current_dir = turn
+        path.append((step_x, step_y, current_dir))
+        current_x, current_y = step_x, step_y
+    return path
+
+def measure(build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+def main(length=1000000, seed=1):
+    for turn_chance in (0.05, 0.15, 0.5):
+        random.seed(seed)
+        move_path = winding_path(length, turn_chance)
+        solver = MazeSolver(WallGrid(1, 1), 1, 1, (0, 0), 'NORTH', {(0, 0): 1}, (0, 0))
+        solver.get_unvisited_neighbors = lambda x, y: []
+        solver.scanned_cells.add((0, 0))
+        solver.a_star_multi_target = lambda start, targets, visited: move_path
+        tuples, tuple_size = measure(lambda: tuple_plan(solver, move_path))
+        del tuples
+        _, plan_size = measure(solver.initialize_path)
+        print(f"turn chance {turn_chance}: {len(solver.path)} entries in {len(solver.path.ends)} segments, "
+              f"tuples {tuple_size / 1e6:.1f} MB, plan {plan_size / 1e6:.1f} MB ({tuple_size / plan_size:.1f}x)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
\ No newline at end of file
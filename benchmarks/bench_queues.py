@@ -0,0 +1,40 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_solver import MazeSolver
+from wall_grid import WallGrid, EAST, SOUTH
+
+def random_grid(size, density):
+    walls = WallGrid(size, size)
+    for y in range(size):
+        for x in range(size):
+            if random.random() < density:
+                walls.set_wall(x, y, EAST)
+            if random.random() < density:
+                walls.set_wall(x, y, SOUTH)
+    return walls
+
+def main(sizes=(100, 500, 1000, 2000), density=0.3, seed=1):
+    for size in sizes:
+        random.seed(seed)
+        walls = random_grid(size, density)
+        visited = {(random.randrange(size), random.randrange(size)): random.randint(1, 4)
+                   for _ in range(size * size // 4)}
+        start = (size // 2, size // 2)
+        targets = [(0, 0), (size - 1, 0), (0, size - 1), (size - 1, size - 1)]
+        results = []
+        for queue in ('heap', 'bucket'):
+            solver = MazeSolver(walls, size, size, start, 'NORTH', visited, start, queue=queue)
+            solver.known_walls = walls
+            started = time.perf_counter()
+            solver.a_star_multi_target(start, targets, visited)
+            results.append((queue, time.perf_counter() - started, solver.expansions))
+        print(f"grid {size}x{size}: " + ", ".join(
+            f"{queue} {elapsed:.3f} s ({expanded} expanded)" for queue, elapsed, expanded in results))
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (100, 500, 1000, 2000))
\ No newline at end of file
@@ -0,0 +1,57 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dstar_lite import DStarLite
+from maze_generator import MazeGenerator
+from maze_solver import MazeSolver
+from wall_grid import OFFSETS
+
+def full_replan_expansions(solver):
+    planner = DStarLite(solver.known_walls, solver.rows, solver.cols, solver.move_cost)
+    planner.set_start(solver.planner.start)
+    for cell in solver.planner.goals:
+        planner.add_goal(cell)
+    return planner.compute()
+
+def main(size=150, density=0.5, edits=0.02, seed=1):
+    random.seed(seed)
+    generator = MazeGenerator(size, size, density)
+    generator.generate_maze_kruskal()
+    walls = generator.get_walls()
+    start = (size // 2, size // 2)
+    solver = MazeSolver(walls, size, size, start, 'NORTH', {start: 1}, start, planner='dstar')
+
+    replans = 0
+    full_expansions = 0
+    replan = solver.replan_to_frontier
+
+    def counted_replan():
+        nonlocal replans, full_expansions
+        path = replan()
+        replans += 1
+        full_expansions += full_replan_expansions(solver)
+        return path
+
+    solver.replan_to_frontier = counted_replan
+    started = time.perf_counter()
+    steps = 0
+    while solver.get_next_step():
+        steps += 1
+        if random.random() < edits:
+            x, y, direction = random.randrange(size), random.randrange(size), random.randrange(4)
+            dx, dy = OFFSETS[direction]
+            if walls.in_bounds(x + dx, y + dy):
+                walls.toggle_wall(x, y, direction)
+                solver.wall_toggled(x, y, direction)
+    elapsed = time.perf_counter() - started
+
+    print(f"maze {size}x{size}, {steps} steps, {replans} replans, {elapsed:.2f} s")
+    print(f"incremental expansions: {solver.expansions}")
+    print(f"full replan expansions: {full_expansions}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,23 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_generator import MazeGenerator
+
+def main(size=2000, tile_size=512, density=0.5, seed=1):
+    counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    baseline = None
+    print(f"maze {size}x{size}, tiles {tile_size}x{tile_size}, {os.cpu_count()} cores")
+    for workers in counts:
+        generator = MazeGenerator(size, size, density, rng=random.Random(seed))
+        started = time.perf_counter()
+        generator.generate_maze_tiled(tile_size, workers)
+        elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(f"  {workers} workers: {elapsed:.2f} s ({baseline / elapsed:.2f}x)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
\ No newline at end of file
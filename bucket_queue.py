@@ -0,0 +1,54 @@
+import heapq
+
+class HeapQueue:
+    def __init__(self):
+        self.heap = []
+
+    def push(self, priority, item):
+        heapq.heappush(self.heap, (priority, item))
+
+    def pop(self):
+        return heapq.heappop(self.heap)
+
+    def __len__(self):
+        return len(self.heap)
+
+class BucketQueue:
+    def __init__(self, span=64):
+        self.buckets = [[] for _ in range(span)]
+        self.cursor = 0
+        self.size = 0
+
+    def push(self, priority, item):
+        offset = priority - self.cursor
+        if offset < 0:
+            raise ValueError("priority below the last popped priority")
+        if offset >= len(self.buckets):
+            self.grow(offset + 1)
+        self.buckets[priority % len(self.buckets)].append(item)
+        self.size += 1
+
+    def grow(self, needed):
+        span = len(self.buckets)
+        new_span = span * 2
+        while new_span < needed:
+            new_span *= 2
+        buckets = [[] for _ in range(new_span)]
+        for priority in range(self.cursor, self.cursor + span):
+            buckets[priority % new_span] = self.buckets[priority % span]
+        self.buckets = buckets
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("pop from an empty bucket queue")
+        buckets = self.buckets
+        span = len(buckets)
+        bucket = buckets[self.cursor % span]
+        while not bucket:
+            self.cursor += 1
+            bucket = buckets[self.cursor % span]
+        self.size -= 1
+        return self.cursor, bucket.pop()
+
+    def __len__(self):
+        return self.size
\ No newline at end of file
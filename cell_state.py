@@ -0,0 +1,191 @@
+import re
+from array import array
+
+MAX_VISITS = 0xFFFF
+NONZERO = re.compile(b'[^\x00]')
+
+class VisitCounts:
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.counts = array('H', bytes(2 * rows * cols))
+        self.size = 0
+        self.shared = False
+
+    @classmethod
+    def from_dict(cls, visited, rows, cols):
+        counts = cls(rows, cols)
+        for key, value in visited.items():
+            if counts.index(key) >= 0:
+                counts[key] = value
+        return counts
+
+    def copy(self):
+        other = VisitCounts.__new__(VisitCounts)
+        other.rows = self.rows
+        other.cols = self.cols
+        other.counts = self.counts
+        other.size = self.size
+        self.shared = other.shared = True
+        return other
+
+    def own(self):
+        if self.shared:
+            self.counts = array('H', self.counts)
+            self.shared = False
+
+    def index(self, key):
+        x, y = key
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            return y * self.cols + x
+        return -1
+
+    def get(self, key, default=None):
+        index = self.index(key)
+        if index < 0 or not self.counts[index]:
+            return default
+        return self.counts[index]
+
+    def __getitem__(self, key):
+        index = self.index(key)
+        if index < 0 or not self.counts[index]:
+            raise KeyError(key)
+        return self.counts[index]
+
+    def __setitem__(self, key, value):
+        index = self.index(key)
+        if index < 0:
+            raise KeyError(key)
+        self.own()
+        value = max(0, min(MAX_VISITS, value))
+        self.size += (value > 0) - (self.counts[index] > 0)
+        self.counts[index] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self[key] = 0
+
+    def __contains__(self, key):
+        index = self.index(key)
+        return index >= 0 and self.counts[index] > 0
+
+    def __len__(self):
+        return self.size
+
+    def __eq__(self, other):
+        if isinstance(other, VisitCounts):
+            return self.cols == other.cols and self.counts == other.counts
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __iter__(self):
+        cols = self.cols
+        for index in self.indices():
+            yield index % cols, index // cols
+
+    def indices(self):
+        last = -1
+        for match in NONZERO.finditer(self.counts.tobytes()):
+            index = match.start() // 2
+            if index != last:
+                last = index
+                yield index
+
+    def visit(self, index):
+        self.own()
+        count = self.counts[index]
+        if not count:
+            self.size += 1
+        if count < MAX_VISITS:
+            self.counts[index] = count + 1
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        counts = self.counts
+        for index in self.indices():
+            yield counts[index]
+
+    def items(self):
+        counts = self.counts
+        cols = self.cols
+        for index in self.indices():
+            yield (index % cols, index // cols), counts[index]
+
+    def to_dict(self):
+        return dict(self.items())
+
+class FrontierSet:
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.bits = bytearray((rows * cols + 7) // 8)
+        self.size = 0
+        self.shared = False
+
+    def copy(self):
+        other = FrontierSet.__new__(FrontierSet)
+        other.rows = self.rows
+        other.cols = self.cols
+        other.bits = self.bits
+        other.size = self.size
+        self.shared = other.shared = True
+        return other
+
+    def own(self):
+        if self.shared:
+            self.bits = bytearray(self.bits)
+            self.shared = False
+
+    def index(self, key):
+        x, y = key
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            return y * self.cols + x
+        return -1
+
+    def add(self, key):
+        index = self.index(key)
+        if index < 0:
+            raise KeyError(key)
+        if not self.bits[index >> 3] >> (index & 7) & 1:
+            self.own()
+            self.bits[index >> 3] |= 1 << (index & 7)
+            self.size += 1
+
+    def discard(self, key):
+        index = self.index(key)
+        if index >= 0 and self.bits[index >> 3] >> (index & 7) & 1:
+            self.own()
+            self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+            self.size -= 1
+
+    def clear(self):
+        self.bits = bytearray(len(self.bits))
+        self.size = 0
+        self.shared = False
+
+    def __contains__(self, key):
+        index = self.index(key)
+        return index >= 0 and self.bits[index >> 3] >> (index & 7) & 1 == 1
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        cols = self.cols
+        bits = self.bits
+        for match in NONZERO.finditer(bits):
+            base = match.start()
+            byte = bits[base]
+            for bit in range(8):
+                if byte >> bit & 1:
+                    index = base * 8 + bit
+                    yield index % cols, index // cols
+
+def snapshot(visited, rows, cols):
+    if isinstance(visited, VisitCounts):
+        return visited.copy()
+    return VisitCounts.from_dict(visited, rows, cols)
\ No newline at end of file
@@ -0,0 +1,54 @@
+from array import array
+from wall_grid import EAST, SOUTH, OFFSETS
+
+class Connectivity:
+    def __init__(self, walls):
+        self.walls = walls
+        self.parent = None
+
+    def build(self):
+        walls = self.walls
+        cols = walls.cols
+        cells = walls.cells
+        parent = array('i', range(walls.rows * cols))
+        for cell in range(len(parent)):
+            mask = cells[cell]
+            if not mask & 1 << EAST:
+                self.union(parent, cell, cell + 1)
+            if not mask & 1 << SOUTH:
+                self.union(parent, cell, cell + cols)
+        self.parent = parent
+
+    def find(self, parent, cell):
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    def union(self, parent, cell1, cell2):
+        root1 = self.find(parent, cell1)
+        root2 = self.find(parent, cell2)
+        if root1 != root2:
+            if root1 < root2:
+                parent[root2] = root1
+            else:
+                parent[root1] = root2
+
+    def wall_changed(self, x, y, direction, state):
+        if self.parent is None:
+            return
+        if state:
+            self.parent = None
+            return
+        dx, dy = OFFSETS[direction]
+        cols = self.walls.cols
+        self.union(self.parent, y * cols + x, (y + dy) * cols + x + dx)
+
+    def component(self, pos):
+        if self.parent is None:
+            self.build()
+        x, y = pos
+        return self.find(self.parent, y * self.walls.cols + x)
+
+    def connected(self, start, end):
+        return self.component(start) == self.component(end)
\ No newline at end of file
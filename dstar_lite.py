@@ -0,0 +1,121 @@
+import heapq
+from array import array
+
+INF = float('inf')
+
+class DStarLite:
+    def __init__(self, walls, rows, cols, cost):
+        self.walls = walls
+        self.rows = rows
+        self.cols = cols
+        self.cost = cost
+        self.g = array('d', [INF]) * (rows * cols)
+        self.rhs = array('d', [INF]) * (rows * cols)
+        self.goals = set()
+        self.start = None
+        self.km = 0
+        self.queue = []
+        self.queued = {}
+        self.expanded = 0
+
+    def heuristic(self, cell1, cell2):
+        return abs(cell1 % self.cols - cell2 % self.cols) + abs(cell1 // self.cols - cell2 // self.cols)
+
+    def key(self, cell):
+        value = min(self.g[cell], self.rhs[cell])
+        return (value + self.heuristic(self.start, cell) + self.km, value)
+
+    def enqueue(self, cell):
+        if self.g[cell] != self.rhs[cell]:
+            key = self.key(cell)
+            self.queued[cell] = key
+            heapq.heappush(self.queue, (key[0], key[1], cell))
+        else:
+            self.queued.pop(cell, None)
+
+    def update_vertex(self, cell):
+        if cell not in self.goals:
+            best = INF
+            for neighbor in self.walls.neighbor_ids(cell):
+                value = self.cost(neighbor) + self.g[neighbor]
+                if value < best:
+                    best = value
+            self.rhs[cell] = best
+        self.enqueue(cell)
+
+    def set_start(self, cell):
+        if self.start is not None:
+            self.km += self.heuristic(self.start, cell)
+        self.start = cell
+
+    def add_goal(self, cell):
+        self.goals.add(cell)
+        self.rhs[cell] = 0
+        self.enqueue(cell)
+
+    def remove_goal(self, cell):
+        self.goals.discard(cell)
+        self.update_vertex(cell)
+
+    def wall_changed(self, x, y, direction):
+        cell = y * self.cols + x
+        neighbor = cell + (-self.cols, 1, self.cols, -1)[direction]
+        self.update_vertex(cell)
+        self.update_vertex(neighbor)
+
+    def cost_changed(self, cell):
+        for neighbor in self.walls.neighbor_ids(cell):
+            self.update_vertex(neighbor)
+
+    def compute(self):
+        expanded = 0
+        queue = self.queue
+        start = self.start
+        g = self.g
+        rhs = self.rhs
+        while queue:
+            k1, k2, cell = queue[0]
+            if self.queued.get(cell) != (k1, k2):
+                heapq.heappop(queue)
+                continue
+            if (k1, k2) >= self.key(start) and rhs[start] == g[start]:
+                break
+            heapq.heappop(queue)
+            new_key = self.key(cell)
+            if (k1, k2) < new_key:
+                self.queued[cell] = new_key
+                heapq.heappush(queue, (new_key[0], new_key[1], cell))
+                continue
+            del self.queued[cell]
+            expanded += 1
+            if g[cell] > rhs[cell]:
+                g[cell] = rhs[cell]
+            else:
+                g[cell] = INF
+                self.update_vertex(cell)
+            for neighbor in self.walls.neighbor_ids(cell):
+                self.update_vertex(neighbor)
+        self.expanded += expanded
+        return expanded
+
+    def next_cell(self, cell):
+        best = INF
+        best_neighbor = None
+        for neighbor in self.walls.neighbor_ids(cell):
+            value = self.cost(neighbor) + self.g[neighbor]
+            if value < best:
+                best = value
+                best_neighbor = neighbor
+        return best_neighbor
+
+    def extract_path(self):
+        if self.g[self.start] == INF and self.start not in self.goals:
+            return None
+        path = []
+        cell = self.start
+        while cell not in self.goals:
+            cell = self.next_cell(cell)
+            if cell is None or len(path) > self.rows * self.cols:
+                return None
+            path.append((cell % self.cols, cell // self.cols))
+        return path
\ No newline at end of file
@@ -0,0 +1,91 @@
+import argparse
+import json
+import random
+import sys
+import time
+from maze_generator import MazeGenerator, ALGORITHMS, DEFAULT_ALGORITHM
+from maze_solver import MazeSolver
+from metrics import RunCurves, summary
+from wall_grid import WallGrid, DIRECTIONS
+
+def explore(walls, rows, cols, start, start_dir='NORTH', seed=None, planner='astar', queue='heap'):
+    start = tuple(start)
+    solver = MazeSolver(walls, rows, cols, start, start_dir, {start: 1}, start,
+                        planner=planner, queue=queue, rng=random.Random(seed))
+    robot_x, robot_y = start
+    robot_dir = DIRECTIONS.index(start_dir)
+    steps_count = 0
+    turns_count = 0
+    area_count = 1
+    curves = RunCurves(rows * cols)
+    started = time.perf_counter()
+    for x, y, direction in solver.steps():
+        if direction != robot_dir:
+            robot_dir = direction
+            turns_count += 1
+        elif x != robot_x or y != robot_y:
+            robot_x, robot_y = x, y
+            if solver.visited[(x, y)] == 1:
+                area_count += 1
+            steps_count += 1
+            curves.sample(steps_count, area_count, len(solver.scanned_cells))
+    elapsed = time.perf_counter() - started
+    curves.finish(steps_count, area_count, len(solver.scanned_cells))
+    result = summary(solver.visited, rows, cols, steps_count, turns_count)
+    result.update(time=elapsed, curves=curves.to_dict())
+    return result
+
+def load_maze(filename):
+    if filename.endswith(".maze"):
+        with open(filename, "rb") as f:
+            walls = WallGrid.from_bytes(f.read())
+        return walls, walls.rows, walls.cols, (walls.cols // 2, walls.rows // 2), "NORTH"
+    with open(filename, "r") as f:
+        data = json.load(f)
+    rows = data["rows"]
+    cols = data["cols"]
+    walls = WallGrid.from_dict({(tuple(wall[0]), tuple(wall[1])): wall[2] for wall in data["walls"]}, rows, cols)
+    return walls, rows, cols, tuple(data["robot_pos"]), data["robot_dir"]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="explore", description="Обход лабиринта без графического интерфейса")
+    parser.add_argument("--maze", help="файл лабиринта: .json из интерфейса или .maze")
+    parser.add_argument("--rows", type=int, default=10)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--density", type=int, default=100, help="плотность стен, 0-100")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--algorithm", default=DEFAULT_ALGORITHM, choices=list(ALGORITHMS), help="алгоритм генерации")
+    parser.add_argument("--start", type=int, nargs=2, metavar=("X", "Y"))
+    parser.add_argument("--dir", choices=["NORTH", "EAST", "SOUTH", "WEST"])
+    parser.add_argument("--planner", default="astar", choices=["astar", "dstar"])
+    parser.add_argument("--queue", default="heap", choices=["heap", "bucket"])
+    parser.add_argument("--json", action="store_true", help="вывести результат в формате JSON")
+    args = parser.parse_args(argv)
+
+    start_dir = "NORTH"
+    if args.maze:
+        walls, rows, cols, start, start_dir = load_maze(args.maze)
+    else:
+        rows, cols = args.rows, args.cols
+        generator = MazeGenerator(rows, cols, max(0, min(100, args.density)) / 100, rng=random.Random(args.seed))
+        walls = generator.generate(args.algorithm)
+        start = (cols // 2, rows // 2)
+    if args.start:
+        start = tuple(args.start)
+    if args.dir:
+        start_dir = args.dir
+
+    result = explore(walls, rows, cols, start, start_dir, args.seed, args.planner, args.queue)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False))
+        return
+    for visits, count in result["visits"].items():
+        print(f"{visits} - {count}")
+    print(f"Частота посещений: {result['avg_visits']:.2f}")
+    print(f"Шаги: {result['steps']}")
+    print(f"Повороты: {result['turns']}")
+    print(f"Площадь: {result['area']}")
+    print(f"Время: {result['time']:.3f} с")
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -1,9 +1,16 @@
 import tkinter as tk
 from tkinter import messagebox, filedialog
 import json
+import queue
+import time
 from maze_solver import MazeSolver
-from maze_generator import MazeGenerator
-from collections import Counter
+from maze_generator import MazeGenerator, ALGORITHMS, DEFAULT_ALGORITHM
+from renderer import make_renderer, min_cell_size, MAX_CELL_SIZE
+from step_stream import StepStream
+from cell_state import VisitCounts, FrontierSet
+from connectivity import Connectivity
+from metrics import summary, write_record, RESULTS_FILE
+from wall_grid import WallGrid, DIRECTIONS
 
 class RobotTraversal:
     def __init__(self, root):
@@ -15,15 +22,17 @@ class RobotTraversal:
         self.rows = self.default_rows
         self.cols = self.default_cols
         self.cell_size = 20
-        self.walls = {}
+        self.walls = WallGrid(self.rows, self.cols)
         self.robot_pos = (self.cols // 2, self.rows // 2)
         self.start_pos = self.robot_pos
         self.robot_dir = 'NORTH'
-        self.visited = {}
-        self.scanned_cells = set()
+        self.visited = VisitCounts(self.rows, self.cols)
+        self.scanned_cells = FrontierSet(self.rows, self.cols)
         self.speed = 1
-        self.traversal_path = []
-        self.current_step = 0
+        self.fps = 30
+        self.solver = None
+        self.stream = None
+        self.connectivity = None
         self.steps_count = 0
         self.turns_count = 0
         self.area_count = 1
@@ -32,9 +41,11 @@ class RobotTraversal:
         self.in_auto_mode = False
         self.density = self.default_density
         self.has_maze = False
-        self.offset_x = 0
-        self.offset_y = 0
+        self.follow_robot = False
+        self.pan_x = 0
+        self.pan_y = 0
         self.create_widgets()
+        self.renderer = make_renderer(self.canvas, self)
         self.initialize_game()
 
     def create_widgets(self):
@@ -63,6 +74,9 @@ class RobotTraversal:
             ("Пауза", self.toggle_pause_resume),
             ("Быстрее", self.speed_up),
             ("Медленнее", self.slow_down),
+            ("Следить", self.toggle_follow),
+            ("Вписать", self.fit_view),
+            ("До конца", self.skip_to_end),
         ]
 
         for i, (text, command) in enumerate(buttons):
@@ -89,9 +103,17 @@ class RobotTraversal:
         self.density_entry = tk.Entry(self.settings_panel, width=5)
         self.density_entry.grid(row=2, column=1, sticky=tk.W)
         self.density_entry.insert(0, str(self.default_density))
+        tk.Label(self.settings_panel, text="Кадры/с:").grid(row=3, column=0, sticky=tk.W)
+        self.fps_entry = tk.Entry(self.settings_panel, width=5)
+        self.fps_entry.grid(row=3, column=1, sticky=tk.W)
+        self.fps_entry.insert(0, str(self.fps))
+        tk.Label(self.settings_panel, text="Алгоритм:").grid(row=4, column=0, sticky=tk.W)
+        self.algorithm = tk.StringVar(self.root, value=DEFAULT_ALGORITHM)
+        self.algorithm_menu = tk.OptionMenu(self.settings_panel, self.algorithm, *ALGORITHMS)
+        self.algorithm_menu.grid(row=4, column=1, sticky=tk.W)
 
         self.apply_btn = tk.Button(self.settings_panel, text="Применить", command=self.apply_settings)
-        self.apply_btn.grid(row=3, column=0, columnspan=2, pady=5)
+        self.apply_btn.grid(row=5, column=0, columnspan=2, pady=5)
 
         self.status_panel = tk.Frame(self.right_frame)
         self.status_panel.pack(fill=tk.X, padx=5, pady=5)
@@ -126,12 +148,43 @@ class RobotTraversal:
         self.canvas.bind("<Button-1>", self.toggle_wall)
         self.canvas.bind("<Button-3>", self.move_robot_to_cell)
         self.canvas.bind("<Configure>", self.on_canvas_resize)
+        self.canvas.bind("<MouseWheel>", self.zoom_view)
+        self.canvas.bind("<Button-4>", self.zoom_view)
+        self.canvas.bind("<Button-5>", self.zoom_view)
+        self.canvas.bind("<ButtonPress-2>", self.start_pan)
+        self.canvas.bind("<B2-Motion>", self.pan_view)
 
     def on_canvas_resize(self, event):
+        if not self.renderer.view_fixed:
+            self.update_cell_size()
+        self.draw_field()
+
+    def zoom_view(self, event):
+        if event.num == 5 or event.delta < 0:
+            size = max(min_cell_size(self.rows, self.cols), self.cell_size * 4 // 5)
+        else:
+            size = min(MAX_CELL_SIZE, self.cell_size * 5 // 4 + 1)
+        if size != self.cell_size:
+            self.renderer.zoom_at(event.x, event.y, size)
+
+    def start_pan(self, event):
+        self.pan_x, self.pan_y = event.x, event.y
+
+    def pan_view(self, event):
+        self.renderer.pan(event.x - self.pan_x, event.y - self.pan_y)
+        self.pan_x, self.pan_y = event.x, event.y
+
+    def toggle_follow(self):
+        self.follow_robot = not self.follow_robot
+        self.renderer.mark_robot()
+        self.renderer.flush()
+
+    def fit_view(self):
         self.update_cell_size()
         self.draw_field()
 
     def update_cell_size(self):
+        self.renderer.reset_view()
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         if canvas_width > 10 and canvas_height > 10:
@@ -139,16 +192,17 @@ class RobotTraversal:
                 (canvas_width - 40) // max(1, self.cols),
                 (canvas_height - 40) // max(1, self.rows)
             )
-            self.cell_size = max(5, self.cell_size)
+            self.cell_size = max(min_cell_size(self.rows, self.cols), self.cell_size)
 
     def apply_settings(self):
         try:
             new_rows = int(self.rows_entry.get())
             new_cols = int(self.cols_entry.get())
             new_density = int(self.density_entry.get())
-            
-            if new_rows < 1 or new_cols < 1 or new_density < 0 or new_density > 100:
+            new_fps = int(self.fps_entry.get())
+            if new_rows < 1 or new_cols < 1 or new_density < 0 or new_density > 100 or not 1 <= new_fps <= 120:
                 raise ValueError
+            self.fps = new_fps
             
             old_rows = self.rows
             old_cols = self.cols
@@ -209,7 +263,7 @@ class RobotTraversal:
             self.robot_pos = (new_rx, new_ry)
             self.start_pos = self.robot_pos
             
-            new_walls = {}
+            new_walls = WallGrid(self.rows, self.cols)
             for wall, state in self.walls.items():
                 (x1, y1), (x2, y2) = wall
                 new_x1 = x1 + col_shift_left
@@ -221,7 +275,7 @@ class RobotTraversal:
                     new_walls[((new_x1, new_y1), (new_x2, new_y2))] = state
             self.walls = new_walls
             
-            new_visited = {}
+            new_visited = VisitCounts(self.rows, self.cols)
             for pos, count in self.visited.items():
                 x, y = pos
                 new_x = x + col_shift_left
@@ -231,11 +285,13 @@ class RobotTraversal:
             if (new_rx, new_ry) not in new_visited:
                 new_visited[(new_rx, new_ry)] = 1
             self.visited = new_visited
+            self.scanned_cells = FrontierSet(self.rows, self.cols)
             self.area_count = len(self.visited)
 
             self.steps_count = 0
             self.turns_count = 0
             self.has_maze = False
+            self.reset_solver()
             
             self.update_cell_size()
             self.update_status()
@@ -243,13 +299,15 @@ class RobotTraversal:
             self.draw_field()
             
         except ValueError:
-            messagebox.showerror("Ошибка", "Пожалуйста, введите корректные значения\n(Вертикаль и Горизонталь - целые > 0, Плотность 0-100)")
+            messagebox.showerror("Ошибка", "Пожалуйста, введите корректные значения\n(Вертикаль и Горизонталь - целые > 0, Плотность 0-100, Кадры/с 1-120)")
             self.rows_entry.delete(0, tk.END)
             self.rows_entry.insert(0, str(self.rows))
             self.cols_entry.delete(0, tk.END)
             self.cols_entry.insert(0, str(self.cols))
             self.density_entry.delete(0, tk.END)
             self.density_entry.insert(0, str(self.density))
+            self.fps_entry.delete(0, tk.END)
+            self.fps_entry.insert(0, str(self.fps))
 
     def initialize_game(self):
         self.visited[self.robot_pos] = 1
@@ -257,110 +315,29 @@ class RobotTraversal:
         self.draw_field()
 
     def draw_field(self):
-        self.canvas.delete("all")
-        
-        field_width = self.cols * self.cell_size
-        field_height = self.rows * self.cell_size
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-        self.offset_x = (canvas_width - field_width) // 2 if canvas_width > field_width else 0
-        self.offset_y = (canvas_height - field_height) // 2 if canvas_height > field_height else 0
-        
-        for y in range(self.rows):
-            for x in range(self.cols):
-                visit_count = self.visited.get((x, y), 0)
-                
-                if (x, y) == self.robot_pos:
-                    base_color = "blue"
-                elif (x, y) in self.scanned_cells and visit_count == 0:
-                    base_color = "yellow"
-                elif visit_count > 0:
-                    base_color = "#00FF00" if visit_count == 1 else \
-                                "#FFA500" if visit_count == 2 else \
-                                "#800080" if visit_count == 3 else \
-                                "#FF0000" if visit_count >= 4 else "#FFFFFF"
-                else:
-                    base_color = "white"
-                    
-                self.canvas.create_rectangle(
-                    self.offset_x + x * self.cell_size, self.offset_y + y * self.cell_size,
-                    self.offset_x + (x + 1) * self.cell_size, self.offset_y + (y + 1) * self.cell_size,
-                    fill=base_color, outline="gray"
-                )
-                
-                if visit_count > 0 and (x, y) != self.robot_pos:
-                    self.canvas.create_text(
-                        self.offset_x + x * self.cell_size + self.cell_size//2,
-                        self.offset_y + y * self.cell_size + self.cell_size//2,
-                        text=str(visit_count),
-                        fill="black" if visit_count <= 2 else "white"
-                    )
-        
-        for (x1, y1), (x2, y2) in self.walls:
-            if self.walls[((x1, y1), (x2, y2))]:
-                if x1 == x2 and 0 <= y1 < self.rows and 0 <= y2 <= self.rows:
-                    y = max(y1, y2)
-                    self.canvas.create_line(
-                        self.offset_x + x1 * self.cell_size, self.offset_y + y * self.cell_size,
-                        self.offset_x + (x1 + 1) * self.cell_size, self.offset_y + y * self.cell_size,
-                        width=3, fill="black"
-                    )
-                elif y1 == y2 and 0 <= x1 < self.cols and 0 <= x2 <= self.cols:
-                    x = max(x1, x2)
-                    self.canvas.create_line(
-                        self.offset_x + x * self.cell_size, self.offset_y + y1 * self.cell_size,
-                        self.offset_x + x * self.cell_size, self.offset_y + (y1 + 1) * self.cell_size,
-                        width=3, fill="black"
-                    )
-        
-        self.draw_robot()
+        self.renderer = make_renderer(self.canvas, self, self.renderer)
+        self.renderer.rebuild()
         self.update_status()
 
-    def draw_robot(self):
-        x, y = self.robot_pos
-        size = self.cell_size
-        half = size // 2
-        quarter = size // 4
-        
-        directions = {
-            'NORTH': [
-                self.offset_x + x * size + half, self.offset_y + y * size + quarter,
-                self.offset_x + x * size + quarter, self.offset_y + y * size + 3 * quarter,
-                self.offset_x + x * size + 3 * quarter, self.offset_y + y * size + 3 * quarter
-            ],
-            'EAST': [
-                self.offset_x + x * size + 3 * quarter, self.offset_y + y * size + half,
-                self.offset_x + x * size + quarter, self.offset_y + y * size + quarter,
-                self.offset_x + x * size + quarter, self.offset_y + y * size + 3 * quarter
-            ],
-            'SOUTH': [
-                self.offset_x + x * size + half, self.offset_y + y * size + 3 * quarter,
-                self.offset_x + x * size + quarter, self.offset_y + y * size + quarter,
-                self.offset_x + x * size + 3 * quarter, self.offset_y + y * size + quarter
-            ],
-            'WEST': [
-                self.offset_x + x * size + quarter, self.offset_y + y * size + half,
-                self.offset_x + x * size + 3 * quarter, self.offset_y + y * size + quarter,
-                self.offset_x + x * size + 3 * quarter, self.offset_y + y * size + 3 * quarter
-            ]
-        }
-        
-        self.canvas.create_polygon(
-            directions[self.robot_dir], 
-            fill="white", 
-            outline="black"
-        )
-
     def scan_environment(self):
+        for cell in self.scanned_cells:
+            self.renderer.mark_cell(*cell)
         self.scanned_cells.clear()
         for pos in self.visited:
             x, y = pos
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.cols and 0 <= ny < self.rows and (nx, ny) not in self.visited:
-                    wall_key = ((x, y), (nx, ny)) if (x, y) < (nx, ny) else ((nx, ny), (x, y))
-                    if not self.walls.get(wall_key, False):
-                        self.scanned_cells.add((nx, ny))
+            for nx, ny in self.walls.open_neighbors(x, y):
+                if (nx, ny) not in self.visited:
+                    self.scanned_cells.add((nx, ny))
+        for cell in self.scanned_cells:
+            self.renderer.mark_cell(*cell)
+
+    def expand_frontier(self, pos):
+        self.scanned_cells.discard(pos)
+        x, y = pos
+        for nx, ny in self.walls.open_neighbors(x, y):
+            if (nx, ny) not in self.visited and (nx, ny) not in self.scanned_cells:
+                self.scanned_cells.add((nx, ny))
+                self.renderer.mark_cell(nx, ny)
 
     def update_status(self):
         self.steps_label.config(text=f"Шаги: {self.steps_count}")
@@ -379,23 +356,22 @@ class RobotTraversal:
         density = max(0, min(1, density))
         
         generator = MazeGenerator(self.rows, self.cols, density)
-        generator.generate_maze_kruskal()
-        self.walls = generator.get_walls()
+        self.walls = generator.generate(self.algorithm.get())
         self.has_maze = True
         self.scan_environment()
         self.draw_field()
 
     def clear_field(self):
-        self.visited = {self.robot_pos: 1}
-        self.scanned_cells = set()
+        self.visited = VisitCounts(self.rows, self.cols)
+        self.visited[self.robot_pos] = 1
+        self.scanned_cells = FrontierSet(self.rows, self.cols)
         self.steps_count = 0
         self.turns_count = 0
         self.area_count = 1
         if self.auto_traverse_id:
             self.root.after_cancel(self.auto_traverse_id)
             self.auto_traverse_id = None
-        self.traversal_path = []
-        self.current_step = 0
+        self.reset_solver()
         self.is_paused = False
         self.in_auto_mode = False
         self.update_status()
@@ -403,12 +379,13 @@ class RobotTraversal:
         self.draw_field()
 
     def reset_field(self):
-        self.walls = {}
+        self.walls = WallGrid(self.rows, self.cols)
         self.robot_pos = (self.cols // 2, self.rows // 2)
         self.start_pos = self.robot_pos
         self.robot_dir = 'NORTH'
-        self.visited = {self.robot_pos: 1}
-        self.scanned_cells = set()
+        self.visited = VisitCounts(self.rows, self.cols)
+        self.visited[self.robot_pos] = 1
+        self.scanned_cells = FrontierSet(self.rows, self.cols)
         self.steps_count = 0
         self.turns_count = 0
         self.area_count = 1
@@ -416,8 +393,7 @@ class RobotTraversal:
         if self.auto_traverse_id:
             self.root.after_cancel(self.auto_traverse_id)
             self.auto_traverse_id = None
-        self.traversal_path = []
-        self.current_step = 0
+        self.reset_solver()
         self.is_paused = False
         self.in_auto_mode = False
         self.update_status()
@@ -425,11 +401,10 @@ class RobotTraversal:
         self.draw_field()
 
     def toggle_wall(self, event):
-        x = int((event.x - self.offset_x) // self.cell_size)
-        y = int((event.y - self.offset_y) // self.cell_size)
+        x, y = self.renderer.cell_at(event.x, event.y)
         
-        rel_x = ((event.x - self.offset_x) % self.cell_size) / self.cell_size
-        rel_y = ((event.y - self.offset_y) % self.cell_size) / self.cell_size
+        rel_x = ((event.x - self.renderer.offset_x) % self.cell_size) / self.cell_size
+        rel_y = ((event.y - self.renderer.offset_y) % self.cell_size) / self.cell_size
         
         if rel_x < 0.2 and x > 0:
             wall_key = ((x-1, y), (x, y))
@@ -441,47 +416,42 @@ class RobotTraversal:
             wall_key = ((x, y), (x, y+1))
         else:
             return
+        if self.walls.edge(*wall_key) is None:
+            return
+        self.sync_solver()
         
-        self.walls[wall_key] = not self.walls.get(wall_key, False)
+        state = not self.walls.get(wall_key, False)
+        self.walls[wall_key] = state
+        self.get_connectivity().wall_changed(*self.walls.edge(*wall_key), state)
+        self.renderer.mark_wall(wall_key)
+        if self.solver:
+            self.solver.wall_toggled(*self.walls.edge(*wall_key))
         self.scan_environment()
-        self.draw_field()
+        self.renderer.flush()
+        self.update_status()
 
     def move_robot_to_cell(self, event):
-        x = int((event.x - self.offset_x) // self.cell_size)
-        y = int((event.y - self.offset_y) // self.cell_size)
+        x, y = self.renderer.cell_at(event.x, event.y)
         
         if 0 <= x < self.cols and 0 <= y < self.rows:
-            path = self.find_path(self.robot_pos, (x, y))
-            if path:
-                self.visited = {(x, y): 1}
+            if self.get_connectivity().connected(self.robot_pos, (x, y)):
+                self.sync_solver()
+                self.visited = VisitCounts(self.rows, self.cols)
+                self.visited[(x, y)] = 1
                 self.robot_pos = (x, y)
                 self.area_count = 1
+                if self.solver:
+                    self.solver.robot_teleported(self.robot_pos, self.visited)
                 self.scanned_cells.clear()
                 self.scan_environment()
                 self.draw_field()
             else:
                 messagebox.showinfo("Ошибка", "Невозможно переместить робота - путь заблокирован стенами")
 
-    def find_path(self, start, end):
-        queue = [(start, [start])]
-        visited = set()
-        
-        while queue:
-            (x, y), path = queue.pop(0)
-            if (x, y) == end:
-                return path
-                
-            if (x, y) in visited:
-                continue
-            visited.add((x, y))
-            
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.cols and 0 <= ny < self.rows:
-                    wall_key = ((x, y), (nx, ny)) if (x, y) < (nx, ny) else ((nx, ny), (x, y))
-                    if not self.walls.get(wall_key, False) and (nx, ny) not in visited:
-                        queue.append(((nx, ny), path + [(nx, ny)]))
-        return None
+    def get_connectivity(self):
+        if self.connectivity is None or self.connectivity.walls is not self.walls:
+            self.connectivity = Connectivity(self.walls)
+        return self.connectivity
 
     def turn_robot(self, direction):
         directions = {
@@ -490,14 +460,14 @@ class RobotTraversal:
             'SOUTH': {'LEFT': 'EAST', 'RIGHT': 'WEST'},
             'WEST': {'LEFT': 'SOUTH', 'RIGHT': 'NORTH'}
         }
+        self.sync_solver()
         self.robot_dir = directions[self.robot_dir][direction]
         self.turns_count += 1
-        if self.in_auto_mode:
-            self.traversal_path = []
-            self.current_step = 0
+        if self.solver:
+            self.solver.robot_turned(self.robot_dir)
         self.update_status()
-        self.scan_environment()
-        self.draw_field()
+        self.renderer.mark_robot()
+        self.renderer.flush()
 
     def manual_move(self):
         x, y = self.robot_pos
@@ -510,24 +480,25 @@ class RobotTraversal:
         dx, dy = direction_offsets[self.robot_dir]
         new_x, new_y = x + dx, y + dy
 
-        wall_key = ((x, y), (new_x, new_y)) if (x, y) < (new_x, new_y) else ((new_x, new_y), (x, y))
-        
-        if (0 <= new_x < self.cols and 0 <= new_y < self.rows and 
-            not self.walls.get(wall_key, False)):
+        if not self.walls.has_wall(x, y, DIRECTIONS.index(self.robot_dir)):
+            self.sync_solver()
+            prev_pos = self.robot_pos
             self.robot_pos = (new_x, new_y)
             if (new_x, new_y) not in self.visited:
                 self.area_count += 1
             self.visited[(new_x, new_y)] = self.visited.get((new_x, new_y), 0) + 1
             self.steps_count += 1
-            if self.in_auto_mode:
-                self.traversal_path = []
-                self.current_step = 0
-            self.scan_environment()
+            if self.solver:
+                self.solver.robot_moved(self.robot_pos)
+            self.renderer.mark_cell(*prev_pos)
+            self.renderer.mark_cell(new_x, new_y)
+            self.expand_frontier(self.robot_pos)
+            self.renderer.mark_robot()
+            self.renderer.flush()
         else:
             messagebox.showinfo("Препятствие", "Невозможно двигаться вперёд. Обнаружена стена.")
 
         self.update_status()
-        self.draw_field()
 
     def toggle_auto_traverse(self):
         if not self.in_auto_mode:
@@ -537,70 +508,98 @@ class RobotTraversal:
         else:
             self.pause_auto_traverse()
 
+    def get_solver(self):
+        if self.solver is None:
+            self.solver = MazeSolver(self.walls, self.rows, self.cols, self.robot_pos, self.robot_dir, self.visited, self.start_pos)
+            self.solver.scanned_cells = self.scanned_cells.copy()
+        return self.solver
+
+    def get_stream(self):
+        if self.stream is None:
+            self.stream = StepStream(self.get_solver())
+        self.stream.start()
+        return self.stream
+
+    def sync_solver(self):
+        if self.stream:
+            steps = self.stream.drain()
+            self.stream = None
+            if steps:
+                self.solver.steps_discarded(steps, self.robot_pos, self.robot_dir, self.visited, self.scanned_cells)
+
+    def reset_solver(self):
+        if self.stream:
+            self.stream.stop()
+            self.stream = None
+        self.solver = None
+
     def start_auto_traverse(self):
         self.in_auto_mode = True
-        self.traversal_path = []
-        self.current_step = 0
         self.is_paused = False
-        self.auto_traverse_step()
-
-    def auto_traverse_step(self):
-        if not self.scanned_cells and not self.traversal_path[self.current_step:]:
-            self.in_auto_mode = False
-            self.write_result()
-            self.draw_field()
-            messagebox.showinfo("Завершено", "Путешествие завершено.")
-            return
-
-        if self.is_paused:
-            return
+        self.auto_traverse_frame()
 
-        if self.current_step >= len(self.traversal_path):
-            solver = MazeSolver(self.walls, self.rows, self.cols, self.robot_pos, self.robot_dir, self.visited, self.start_pos)
-            solver.scanned_cells = self.scanned_cells.copy()
-            path = []
-            step = solver.get_next_step()
-            while step:
-                path.append(step)
-                step = solver.get_next_step()
-            self.traversal_path = path
-            self.current_step = 0
-            if not self.traversal_path:
-                self.in_auto_mode = False
-                self.write_result()
-                self.draw_field()
-                messagebox.showinfo("Завершено", "Путешествие завершено.")
-                return
-
-        x, y, direction = self.traversal_path[self.current_step]
-        
+    def advance(self, step):
+        x, y, direction = step
         if direction != self.robot_dir:
             self.robot_dir = direction
             self.turns_count += 1
-            self.current_step += 1
-            self.auto_traverse_id = self.root.after(0, self.auto_traverse_step)
+            self.renderer.mark_robot()
             return
-        
         if (x, y) != self.robot_pos:
+            self.renderer.mark_cell(*self.robot_pos)
             self.robot_pos = (x, y)
             if (x, y) not in self.visited:
                 self.area_count += 1
             self.visited[(x, y)] = self.visited.get((x, y), 0) + 1
             self.steps_count += 1
-            self.scan_environment()
-        
-        self.current_step += 1
-        self.auto_traverse_id = self.root.after(0, self.auto_traverse_step)
+            self.renderer.mark_cell(x, y)
+            self.renderer.mark_robot()
+            self.expand_frontier(self.robot_pos)
+
+    def auto_traverse_frame(self):
+        if self.is_paused:
+            return
+        stream = self.get_stream()
+        deadline = time.perf_counter() + 0.8 / self.fps
+        while time.perf_counter() < deadline:
+            try:
+                step = stream.get_nowait()
+            except queue.Empty:
+                break
+            if step is None:
+                self.finish_auto_traverse()
+                return
+            self.advance(step)
+        self.renderer.flush()
+        self.update_status()
+        self.auto_traverse_id = self.root.after(1000 // self.fps, self.auto_traverse_frame)
+
+    def finish_auto_traverse(self):
+        self.auto_traverse_id = None
+        self.stream = None
+        self.in_auto_mode = False
+        self.write_result()
+        self.draw_field()
+        messagebox.showinfo("Завершено", "Путешествие завершено.")
+
+    def skip_to_end(self):
+        if self.auto_traverse_id:
+            self.root.after_cancel(self.auto_traverse_id)
+            self.auto_traverse_id = None
+        self.in_auto_mode = True
+        self.is_paused = False
+        self.sync_solver()
+        solver = self.get_solver()
+        step = solver.get_next_step()
+        while step:
+            self.advance(step)
+            step = solver.get_next_step()
+        self.finish_auto_traverse()
 
     def write_result(self):
-        visit_counts = Counter(self.visited.values())
-        total_visits = sum(visits * count for visits, count in visit_counts.items())
-        total_cells = len(self.visited)
-        avg_visits = total_visits / total_cells if total_cells > 0 else 0
-        with open("res.txt", "w", encoding="utf-8") as f:
-            for visits, count in sorted(visit_counts.items()):
-                f.write(f"{visits} - {count}\n")
-            f.write(f"Частота посещений: {avg_visits:.2f}\n")
+        record = summary(self.visited, self.rows, self.cols, self.steps_count, self.turns_count)
+        record.update(rows=self.rows, cols=self.cols, density=self.density, has_maze=self.has_maze)
+        write_record(RESULTS_FILE, record)
 
     def toggle_pause_resume(self):
         if self.is_paused:
@@ -613,13 +612,12 @@ class RobotTraversal:
             self.is_paused = True
             self.root.after_cancel(self.auto_traverse_id)
             self.auto_traverse_id = None
+            self.sync_solver()
 
     def resume_auto_traverse(self):
         if self.is_paused:
             self.is_paused = False
-            self.traversal_path = []
-            self.current_step = 0
-            self.auto_traverse_step()
+            self.auto_traverse_frame()
 
     def speed_up(self):
         self.speed = max(1, self.speed - 50)
@@ -663,15 +661,17 @@ class RobotTraversal:
                 data = json.load(f)
                 self.rows = data["rows"]
                 self.cols = data["cols"]
-                self.walls = {}
+                self.walls = WallGrid(self.rows, self.cols)
                 for wall in data["walls"]:
                     key = (tuple(wall[0]), tuple(wall[1]))
                     value = wall[2]
-                    self.walls[key] = value
+                    if value and self.walls.edge(*key) is not None:
+                        self.walls[key] = value
                 self.robot_pos = tuple(data["robot_pos"])
                 self.start_pos = tuple(data["start_pos"])
                 self.robot_dir = data["robot_dir"]
-                self.visited = {}
+                self.visited = VisitCounts(self.rows, self.cols)
+                self.scanned_cells = FrontierSet(self.rows, self.cols)
                 for pos in data.get("visited", []):
                     key = tuple(pos[0])
                     value = pos[1]
@@ -692,8 +692,7 @@ class RobotTraversal:
                 if self.auto_traverse_id:
                     self.root.after_cancel(self.auto_traverse_id)
                     self.auto_traverse_id = None
-                self.traversal_path = []
-                self.current_step = 0
+                self.reset_solver()
                 self.is_paused = False
                 self.in_auto_mode = False
                 
@@ -0,0 +1,109 @@
+import heapq
+from array import array
+from collections import deque
+
+UNREACHABLE = 0xFFFFFFFF
+
+def bfs_distances(walls, source):
+    distances = array('I', [UNREACHABLE]) * (walls.rows * walls.cols)
+    distances[source] = 0
+    frontier = deque([source])
+    while frontier:
+        cell = frontier.popleft()
+        distance = distances[cell] + 1
+        for neighbor in walls.neighbor_ids(cell):
+            if distances[neighbor] == UNREACHABLE:
+                distances[neighbor] = distance
+                frontier.append(neighbor)
+    return distances
+
+class Landmarks:
+    def __init__(self, walls, count=8):
+        self.walls = walls
+        self.count = count
+        self.cells = []
+        self.distances = None
+        self.expansions = 0
+
+    def build(self):
+        size = self.walls.rows * self.walls.cols
+        self.cells = []
+        self.distances = []
+        if not self.count or not size:
+            return
+        nearest = bfs_distances(self.walls, 0)
+        for _ in range(self.count):
+            cell = max(range(size), key=nearest.__getitem__)
+            if nearest[cell] == 0:
+                break
+            distances = bfs_distances(self.walls, cell)
+            if not self.cells:
+                nearest = array('I', distances)
+            else:
+                for index in range(size):
+                    if distances[index] < nearest[index]:
+                        nearest[index] = distances[index]
+            self.cells.append(cell)
+            self.distances.append(distances)
+
+    def invalidate(self):
+        self.distances = None
+
+    def estimator(self, start, end):
+        if self.distances is None:
+            self.build()
+        bounds = []
+        for distances in self.distances:
+            to_start = distances[start]
+            to_end = distances[end]
+            if (to_start == UNREACHABLE) != (to_end == UNREACHABLE):
+                return None
+            if to_end != UNREACHABLE:
+                bounds.append((distances, to_end))
+
+        def heuristic(cell):
+            best = 0
+            for distances, to_end in bounds:
+                estimate = distances[cell] - to_end
+                if estimate < 0:
+                    estimate = -estimate
+                if estimate > best:
+                    best = estimate
+            return best
+
+        return heuristic
+
+    def find_path(self, start, end):
+        walls = self.walls
+        cols = walls.cols
+        start_id = start[1] * cols + start[0]
+        end_id = end[1] * cols + end[0]
+        self.expansions = 0
+        heuristic = self.estimator(start_id, end_id)
+        if heuristic is None:
+            return None
+        cost = array('I', [UNREACHABLE]) * (walls.rows * cols)
+        parent = array('i', [-1]) * (walls.rows * cols)
+        cost[start_id] = 0
+        heap = [(heuristic(start_id), 0, start_id)]
+        while heap:
+            _, g, cell = heapq.heappop(heap)
+            g = -g
+            if g > cost[cell]:
+                continue
+            self.expansions += 1
+            if cell == end_id:
+                path = []
+                while cell != start_id:
+                    path.append((cell % cols, cell // cols))
+                    cell = parent[cell]
+                path.append(start)
+                path.reverse()
+                return path
+            g += 1
+            for neighbor in walls.neighbor_ids(cell):
+                if g < cost[neighbor]:
+                    cost[neighbor] = g
+                    parent[neighbor] = cell
+                    heapq.heappush(heap, (g + heuristic(neighbor), -g, neighbor))
+        return None
\ No newline at end of file
@@ -1,60 +1,342 @@
+import argparse
+import os
 import random
+import re
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from wall_grid import WallGrid, NORTH, EAST, SOUTH, WEST, OPPOSITE
+
+DEFAULT_ALGORITHM = "kruskal"
+TILE_SIZE = 512
+RUN = re.compile(b'\x00*\x01')
+FLIP = bytes([1, 0]) + bytes(254)
 
 class MazeGenerator:
-    def __init__(self, rows, cols, density=0.3):
+    def __init__(self, rows, cols, density=0.3, rng=None):
         self.rows = rows
         self.cols = cols
         self.density = min(max(density, 0.05), 0.95)
-        self.walls = {}
-        self.parent = {}
-        self.rank = {}
-
-    def find(self, cell):
-        if self.parent[cell] != cell:
-            self.parent[cell] = self.find(self.parent[cell])
-        return self.parent[cell]
-
-    def union(self, cell1, cell2):
-        root1 = self.find(cell1)
-        root2 = self.find(cell2)
-        if root1 != root2:
-            if self.rank[root1] < self.rank[root2]:
-                root1, root2 = root2, root1
-            self.parent[root2] = root1
-            if self.rank[root1] == self.rank[root2]:
-                self.rank[root1] += 1
+        self.random = rng or random
+        self.walls = None
 
-    def generate_maze_kruskal(self):
+    def edge_codes(self):
+        edges = array('i')
+        cols = self.cols
         for y in range(self.rows):
-            for x in range(self.cols):
-                cell = (x, y)
-                self.parent[cell] = cell
-                self.rank[cell] = 0
+            first = y * cols
+            if y < self.rows - 1:
+                edges.extend(range(2 * first, 2 * (first + cols - 1)))
+                edges.append(2 * (first + cols - 1) + 1)
+            else:
+                edges.extend(range(2 * first, 2 * (first + cols - 1), 2))
+        return edges
 
-        edges = []
-        for y in range(self.rows):
-            for x in range(self.cols):
-                if x < self.cols - 1:
-                    edges.append(((x, y), (x+1, y)))
-                if y < self.rows - 1:
-                    edges.append(((x, y), (x, y+1)))
-
-        random.shuffle(edges)
-
-        for edge in edges:
-            cell1, cell2 = edge
-            if self.find(cell1) != self.find(cell2):
-                self.walls[edge] = False
-                self.union(cell1, cell2)
+    def generate_maze_kruskal(self):
+        cols = self.cols
+        size = self.rows * cols
+        parent = array('i', range(size))
+        rank = bytearray(size)
+        self.walls = WallGrid(self.rows, cols)
+        cells = self.walls.cells
+        density = self.density
+        chance = self.random.random
+        edges = self.edge_codes()
+        self.random.shuffle(edges)
+
+        for code in edges:
+            cell1 = code >> 1
+            if code & 1:
+                cell2 = cell1 + cols
             else:
-                self.walls[edge] = True if random.random() < self.density else False
+                cell2 = cell1 + 1
+            root1 = cell1
+            while parent[root1] != root1:
+                parent[root1] = parent[parent[root1]]
+                root1 = parent[root1]
+            root2 = cell2
+            while parent[root2] != root2:
+                parent[root2] = parent[parent[root2]]
+                root2 = parent[root2]
+            if root1 != root2:
+                if rank[root1] < rank[root2]:
+                    root1, root2 = root2, root1
+                parent[root2] = root1
+                if rank[root1] == rank[root2]:
+                    rank[root1] += 1
+            elif chance() < density:
+                if code & 1:
+                    cells[cell1] |= 1 << SOUTH
+                    cells[cell2] |= 1 << NORTH
+                else:
+                    cells[cell1] |= 1 << EAST
+                    cells[cell2] |= 1 << WEST
 
+    def generate_rows(self):
+        cols = self.cols
+        density = self.density
+        chance = self.random.random
+        labels = array('i', range(cols))
+        north = bytes([1 << NORTH]) * cols
         for y in range(self.rows):
-            for x in range(self.cols):
-                if x < self.cols - 1 and ((x, y), (x+1, y)) not in self.walls:
-                    self.walls[((x, y), (x+1, y))] = True if random.random() < self.density else False
-                if y < self.rows - 1 and ((x, y), (x, y+1)) not in self.walls:
-                    self.walls[((x, y), (x, y+1))] = True if random.random() < self.density else False
+            last = y == self.rows - 1
+            row = bytearray(north)
+            row[0] |= 1 << WEST
+            row[cols - 1] |= 1 << EAST
+            parent = array('i', range(cols))
+            for x in range(cols - 1):
+                root1 = labels[x]
+                while parent[root1] != root1:
+                    parent[root1] = parent[parent[root1]]
+                    root1 = parent[root1]
+                root2 = labels[x + 1]
+                while parent[root2] != root2:
+                    parent[root2] = parent[parent[root2]]
+                    root2 = parent[root2]
+                if root1 != root2 and (last or chance() < 0.5):
+                    parent[root2] = root1
+                elif chance() < density:
+                    row[x] |= 1 << EAST
+                    row[x + 1] |= 1 << WEST
+            if last:
+                for x in range(cols):
+                    row[x] |= 1 << SOUTH
+                yield bytes(row)
+                return
+            members = {}
+            for x in range(cols):
+                root = labels[x]
+                while parent[root] != root:
+                    root = parent[root]
+                members.setdefault(root, []).append(x)
+            south = bytearray(cols)
+            next_labels = array('i', [-1]) * cols
+            for label, cells in enumerate(members.values()):
+                carried = [x for x in cells if chance() < 0.5]
+                if not carried:
+                    carried = [cells[int(chance() * len(cells))]]
+                for x in carried:
+                    next_labels[x] = label
+            fresh = len(members)
+            for x in range(cols):
+                if next_labels[x] < 0:
+                    next_labels[x] = fresh
+                    fresh += 1
+                    if chance() < density:
+                        row[x] |= 1 << SOUTH
+                        south[x] = 1 << NORTH
+            labels = next_labels
+            north = south
+            yield bytes(row)
+
+    def generate_maze_eller(self):
+        self.walls = WallGrid(self.rows, self.cols)
+        cells = self.walls.cells
+        cols = self.cols
+        for y, row in enumerate(self.generate_rows()):
+            cells[y * cols:(y + 1) * cols] = row
+
+    def write_rows(self, f):
+        f.write(struct.pack('<II', self.rows, self.cols))
+        for row in self.generate_rows():
+            f.write(row)
+
+    def random_plane(self, probability):
+        threshold = round(probability * 256)
+        table = bytes(1 if value < threshold else 0 for value in range(256))
+        return self.random.randbytes(self.rows * self.cols).translate(table)
+
+    def add_loops(self):
+        east, south = self.walls.planes()
+        east = int.from_bytes(east, 'little') & int.from_bytes(self.random_plane(self.density), 'little')
+        south = int.from_bytes(south, 'little') & int.from_bytes(self.random_plane(self.density), 'little')
+        size = self.rows * self.cols
+        self.walls = WallGrid.from_planes(self.rows, self.cols, east.to_bytes(size, 'little'), south.to_bytes(size, 'little'))
+
+    def generate_maze_binary_tree(self):
+        rows, cols = self.rows, self.cols
+        north = bytearray(self.random_plane(0.5))
+        north[:cols] = bytes(cols)
+        north[cols - 1::cols] = bytes([1]) * rows
+        south = bytes(north[cols:]).translate(FLIP) + bytes([1]) * cols
+        self.walls = WallGrid.from_planes(rows, cols, north, south)
+        self.add_loops()
+
+    def generate_maze_sidewinder(self):
+        rows, cols = self.rows, self.cols
+        chance = self.random.random
+        east = bytearray(self.random_plane(0.5))
+        east[:cols] = bytes(cols)
+        east[cols - 1::cols] = bytes([1]) * rows
+        south = bytearray([1]) * (rows * cols)
+        for run in RUN.finditer(east, cols):
+            start, end = run.span()
+            south[start + int(chance() * (end - start)) - cols] = 0
+        self.walls = WallGrid.from_planes(rows, cols, east, south)
+        self.add_loops()
+
+    def closed_grid(self):
+        self.walls = WallGrid(self.rows, self.cols)
+        self.walls.cells[:] = bytes([0xF]) * (self.rows * self.cols)
+        return self.walls.cells
+
+    def generate_maze_backtracker(self):
+        cols = self.cols
+        size = self.rows * cols
+        cells = self.closed_grid()
+        chance = self.random.random
+        steps = (-cols, 1, cols, -1)
+        visited = bytearray(size)
+        start = int(chance() * size)
+        visited[start] = 1
+        stack = array('i', [start])
+        while stack:
+            cell = stack[-1]
+            x = cell % cols
+            options = []
+            if cell >= cols and not visited[cell - cols]:
+                options.append(NORTH)
+            if x < cols - 1 and not visited[cell + 1]:
+                options.append(EAST)
+            if cell + cols < size and not visited[cell + cols]:
+                options.append(SOUTH)
+            if x > 0 and not visited[cell - 1]:
+                options.append(WEST)
+            if not options:
+                stack.pop()
+                continue
+            direction = options[int(chance() * len(options))]
+            neighbor = cell + steps[direction]
+            cells[cell] &= ~(1 << direction)
+            cells[neighbor] &= ~(1 << OPPOSITE[direction])
+            visited[neighbor] = 1
+            stack.append(neighbor)
+        self.add_loops()
+
+    def generate_maze_wilson(self):
+        cols = self.cols
+        size = self.rows * cols
+        cells = self.closed_grid()
+        chance = self.random.random
+        steps = (-cols, 1, cols, -1)
+        in_tree = bytearray(size)
+        heading = bytearray(size)
+        in_tree[int(chance() * size)] = 1
+        for start in range(size):
+            if in_tree[start]:
+                continue
+            cell = start
+            while not in_tree[cell]:
+                direction = int(chance() * 4)
+                if direction == NORTH:
+                    if cell < cols:
+                        continue
+                elif direction == EAST:
+                    if cell % cols == cols - 1:
+                        continue
+                elif direction == SOUTH:
+                    if cell + cols >= size:
+                        continue
+                elif cell % cols == 0:
+                    continue
+                heading[cell] = direction
+                cell += steps[direction]
+            cell = start
+            while not in_tree[cell]:
+                direction = heading[cell]
+                neighbor = cell + steps[direction]
+                cells[cell] &= ~(1 << direction)
+                cells[neighbor] &= ~(1 << OPPOSITE[direction])
+                in_tree[cell] = 1
+                cell = neighbor
+        self.add_loops()
+
+    def place_tiles(self, jobs, tiles, tile_size, tile_cols):
+        cells = self.walls.cells
+        cols = self.cols
+        for index, tile in enumerate(tiles):
+            height, width = jobs[index][:2]
+            x0 = index % tile_cols * tile_size
+            y0 = index // tile_cols * tile_size
+            for y in range(height):
+                start = (y0 + y) * cols + x0
+                cells[start:start + width] = tile[y * width:(y + 1) * width]
+
+    def generate_maze_tiled(self, tile_size=TILE_SIZE, workers=None, algorithm=DEFAULT_ALGORITHM):
+        rows, cols = self.rows, self.cols
+        tile_rows = (rows + tile_size - 1) // tile_size
+        tile_cols = (cols + tile_size - 1) // tile_size
+        base = self.random.getrandbits(64)
+        jobs = []
+        for tile_y in range(tile_rows):
+            for tile_x in range(tile_cols):
+                height = min(tile_size, rows - tile_y * tile_size)
+                width = min(tile_size, cols - tile_x * tile_size)
+                jobs.append((height, width, algorithm, f"tile-{base}-{tile_y}-{tile_x}"))
+        self.walls = WallGrid(rows, cols)
+        if len(jobs) == 1 or workers == 1:
+            self.place_tiles(jobs, map(generate_tile, jobs), tile_size, tile_cols)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunk = max(1, len(jobs) // (4 * (workers or os.cpu_count() or 1)))
+                self.place_tiles(jobs, executor.map(generate_tile, jobs, chunksize=chunk), tile_size, tile_cols)
+        seams = perfect_maze(tile_rows, tile_cols, DEFAULT_ALGORITHM, self.random)
+        for tile_y in range(tile_rows):
+            for tile_x in range(tile_cols):
+                x0, y0 = tile_x * tile_size, tile_y * tile_size
+                if not seams.has_wall(tile_x, tile_y, EAST):
+                    y = y0 + int(self.random.random() * min(tile_size, rows - y0))
+                    self.walls.set_wall(x0 + tile_size - 1, y, EAST, False)
+                if not seams.has_wall(tile_x, tile_y, SOUTH):
+                    x = x0 + int(self.random.random() * min(tile_size, cols - x0))
+                    self.walls.set_wall(x, y0 + tile_size - 1, SOUTH, False)
+        self.add_loops()
+
+    def generate(self, algorithm=DEFAULT_ALGORITHM):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"unknown maze algorithm: {algorithm}")
+        ALGORITHMS[algorithm](self)
+        return self.walls
 
     def get_walls(self):
-        return self.walls
\ No newline at end of file
+        return self.walls
+
+def perfect_maze(rows, cols, algorithm, rng):
+    generator = MazeGenerator(rows, cols, rng=rng)
+    generator.density = 1.0
+    return generator.generate(algorithm)
+
+def generate_tile(job):
+    rows, cols, algorithm, seed = job
+    return bytes(perfect_maze(rows, cols, algorithm, random.Random(seed)).cells)
+
+ALGORITHMS = {
+    "kruskal": MazeGenerator.generate_maze_kruskal,
+    "backtracker": MazeGenerator.generate_maze_backtracker,
+    "wilson": MazeGenerator.generate_maze_wilson,
+    "eller": MazeGenerator.generate_maze_eller,
+    "sidewinder": MazeGenerator.generate_maze_sidewinder,
+    "binary_tree": MazeGenerator.generate_maze_binary_tree,
+    "tiled": MazeGenerator.generate_maze_tiled,
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="maze_generator", description="Генерация лабиринта в файл")
+    parser.add_argument("out", help="файл лабиринта .maze")
+    parser.add_argument("--rows", type=int, default=10)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--density", type=int, default=100, help="плотность стен, 0-100")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--algorithm", default="eller", choices=list(ALGORITHMS),
+                        help="алгоритм генерации; eller пишет файл построчно")
+    args = parser.parse_args(argv)
+    generator = MazeGenerator(args.rows, args.cols, max(0, min(100, args.density)) / 100, rng=random.Random(args.seed))
+    with open(args.out, "wb") as f:
+        if args.algorithm == "eller":
+            generator.write_rows(f)
+        else:
+            f.write(generator.generate(args.algorithm).to_bytes())
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -1,184 +1,359 @@
-import heapq
 import random
+from array import array
+from bucket_queue import BucketQueue, HeapQueue
+from cell_state import FrontierSet, snapshot
+from dstar_lite import DStarLite
+from plan import Plan
+from wall_grid import WallGrid, DIRECTIONS, OFFSETS, NORTH, EAST, SOUTH, WEST, direction_between
+
+SCAN_ORDER = [WEST, EAST, NORTH, SOUTH]
+DIRECTION_CODES = {name: code for code, name in enumerate(DIRECTIONS)}
 
 class MazeSolver:
-    def __init__(self, walls, rows, cols, start_pos, start_dir, visited, start_pos_original):
+    def __init__(self, walls, rows, cols, start_pos, start_dir, visited, start_pos_original, planner='astar', queue='heap', rng=None):
+        if not isinstance(walls, WallGrid):
+            walls = WallGrid.from_dict(walls, rows, cols)
         self.walls = walls
         self.rows = rows
         self.cols = cols
         self.current_pos = start_pos
         self.current_dir = start_dir
-        self.visited = visited.copy()
+        self.visited = snapshot(visited, rows, cols)
         self.start_pos = start_pos_original
         self.directions = ['NORTH', 'EAST', 'SOUTH', 'WEST']
-        self.known_walls = {}
-        self.scanned_cells = set()
-        self.path = []
+        self.known_walls = WallGrid(rows, cols)
+        self.scanned_cells = FrontierSet(rows, cols)
+        self.path = Plan()
         self.path_index = 0
+        self.planner_type = planner
+        self.planner = None
+        self.queue_type = queue
+        self.random = rng or random
+        self.expansions = 0
+        self.replans = 0
         self.scan_environment(start_pos)
 
     def scan_environment(self, pos):
         x, y = pos
-        for dx, dy, _ in [(-1, 0, 'WEST'), (1, 0, 'EAST'), (0, -1, 'NORTH'), (0, 1, 'SOUTH')]:
+        for direction in SCAN_ORDER:
+            dx, dy = OFFSETS[direction]
             nx, ny = x + dx, y + dy
-            wall_key = ((x, y), (nx, ny)) if (x, y) < (nx, ny) else ((nx, ny), (x, y))
-            if nx < 0 or nx >= self.cols or ny < 0 or ny >= self.rows:
-                self.known_walls[wall_key] = True
-            else:
-                self.known_walls[wall_key] = self.walls.get(wall_key, False)
-                if not self.known_walls[wall_key] and (nx, ny) not in self.visited:
-                    self.scanned_cells.add((nx, ny))
+            if 0 <= nx < self.cols and 0 <= ny < self.rows:
+                wall = self.walls.has_wall(x, y, direction)
+                self.learn_wall(x, y, direction, wall)
+                if not wall and not self.visited.counts[ny * self.cols + nx]:
+                    self.add_frontier((nx, ny))
+
+    def learn_wall(self, x, y, direction, wall):
+        if self.known_walls.has_wall(x, y, direction) != wall:
+            self.known_walls.set_wall(x, y, direction, wall)
+            if self.planner:
+                self.planner.wall_changed(x, y, direction)
+
+    def visit(self, pos):
+        self.visited.visit(pos[1] * self.cols + pos[0])
+        if self.planner:
+            self.planner.cost_changed(pos[1] * self.cols + pos[0])
+
+    def add_frontier(self, pos):
+        if pos not in self.scanned_cells:
+            self.scanned_cells.add(pos)
+            if self.planner:
+                self.planner.add_goal(pos[1] * self.cols + pos[0])
+
+    def remove_frontier(self, pos):
+        if pos in self.scanned_cells:
+            self.scanned_cells.discard(pos)
+            if self.planner:
+                self.planner.remove_goal(pos[1] * self.cols + pos[0])
+
+    def move_cost(self, cell):
+        return 1 + self.visited.counts[cell] * 2
+
+    def update_frontier(self, pos):
+        x, y = pos
+        if pos in self.visited:
+            self.remove_frontier(pos)
+            return
+        for nx, ny in self.known_walls.open_neighbors(x, y):
+            if (nx, ny) in self.visited:
+                self.add_frontier(pos)
+                return
+        self.remove_frontier(pos)
+
+    def reset_plan(self):
+        self.path = Plan()
+        self.path_index = 0
+
+    def robot_moved(self, pos):
+        self.current_pos = pos
+        self.visit(pos)
+        self.remove_frontier(pos)
+        self.scan_environment(pos)
+        self.reset_plan()
+
+    def robot_turned(self, direction):
+        self.current_dir = direction
+        self.reset_plan()
+
+    def wall_toggled(self, x, y, direction):
+        dx, dy = OFFSETS[direction]
+        neighbor = (x + dx, y + dy)
+        if (x, y) in self.visited or neighbor in self.visited:
+            self.learn_wall(x, y, direction, self.walls.has_wall(x, y, direction))
+        self.update_frontier((x, y))
+        self.update_frontier(neighbor)
+        self.reset_plan()
+
+    def robot_teleported(self, pos, visited):
+        self.current_pos = pos
+        self.visited = snapshot(visited, self.rows, self.cols)
+        self.known_walls = WallGrid(self.rows, self.cols)
+        self.scanned_cells = FrontierSet(self.rows, self.cols)
+        self.planner = None
+        self.reset_plan()
+        self.scan_environment(pos)
+
+    def steps_discarded(self, steps, pos, direction, visited, frontier):
+        # Rewind to the robot after steps that were computed ahead but never
+        # shown: only cells entered by those steps can hold extra knowledge.
+        self.current_pos = pos
+        self.current_dir = direction
+        self.visited = snapshot(visited, self.rows, self.cols)
+        self.scanned_cells = frontier.copy()
+        for x, y, _ in steps:
+            if (x, y) in self.visited:
+                continue
+            for side in SCAN_ORDER:
+                dx, dy = OFFSETS[side]
+                known = (x + dx, y + dy) in self.visited and self.walls.has_wall(x, y, side)
+                self.known_walls.set_wall(x, y, side, known)
+        self.planner = None
+        self.reset_plan()
 
     def get_wall_count(self, x, y):
-        wall_count = 0
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = x + dx, y + dy
-            wall_key = ((x, y), (nx, ny)) if (x, y) < (nx, ny) else ((nx, ny), (x, y))
-            if nx < 0 or nx >= self.cols or ny < 0 or ny >= self.rows:
-                wall_count += 1
-            elif self.known_walls.get(wall_key, False):
-                wall_count += 1
-        return wall_count
+        return self.known_walls.wall_count(x, y)
 
     def initialize_path(self):
-        self.path = []
+        self.path = Plan()
         self.path_index = 0
-        visited = set(self.visited.keys())
         current_x, current_y = self.current_pos
-        current_dir = self.current_dir
+        current_dir = DIRECTION_CODES[self.current_dir]
 
         neighbors = self.get_unvisited_neighbors(current_x, current_y)
         if neighbors:
-            target = random.choice(neighbors)
+            target = self.random.choice(neighbors)
             move_path = [target]
         else:
-            targets = self.find_all_unvisited()
+            targets = self.scanned_cells
             if not targets:
                 return
-            move_path = self.a_star_multi_target((current_x, current_y), targets, visited)
+            self.replans += 1
+            if self.planner_type == 'dstar':
+                move_path = self.replan_to_frontier()
+            else:
+                move_path = self.a_star_multi_target((current_x, current_y), targets, self.visited)
             if not move_path:
                 return
 
-        for step in move_path:
-            step_x, step_y = step
+        for step_x, step_y in move_path:
             if step_x > current_x:
-                step_dir = 'EAST'
+                step_dir = EAST
             elif step_x < current_x:
-                step_dir = 'WEST'
+                step_dir = WEST
             elif step_y > current_y:
-                step_dir = 'SOUTH'
+                step_dir = SOUTH
             else:
-                step_dir = 'NORTH'
+                step_dir = NORTH
 
             if step_dir != current_dir:
-                turns = self.get_required_turns(current_dir, step_dir)
-                for turn in turns:
-                    self.path.append((current_x, current_y, turn))
+                for turn in self.turn_codes(current_dir, step_dir):
+                    self.path.turn(current_x, current_y, turn)
                     current_dir = turn
 
             if (step_x, step_y) != (current_x, current_y):
-                self.path.append((step_x, step_y, current_dir))
-                visited.add((step_x, step_y))
+                self.path.move(current_x, current_y, current_dir)
                 current_x, current_y = step_x, step_y
 
     def get_unvisited_neighbors(self, x, y):
         neighbors = []
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < self.cols and 0 <= ny < self.rows:
-                wall_key = ((x, y), (nx, ny)) if (x, y) < (nx, ny) else ((nx, ny), (x, y))
-                if not self.known_walls.get(wall_key, False) and (nx, ny) not in self.visited:
-                    neighbors.append((nx, ny))
+        for direction in SCAN_ORDER:
+            if not self.known_walls.has_wall(x, y, direction):
+                dx, dy = OFFSETS[direction]
+                if not self.visited.counts[(y + dy) * self.cols + x + dx]:
+                    neighbors.append((x + dx, y + dy))
         return neighbors
 
     def find_all_unvisited(self):
         return list(self.scanned_cells)
 
+    def replan_to_frontier(self):
+        x, y = self.current_pos
+        if self.planner is None:
+            self.planner = DStarLite(self.known_walls, self.rows, self.cols, self.move_cost)
+            self.planner.set_start(y * self.cols + x)
+            for fx, fy in self.scanned_cells:
+                self.planner.add_goal(fy * self.cols + fx)
+        planner = self.planner
+        planner.set_start(y * self.cols + x)
+        self.expansions += planner.compute()
+        return planner.extract_path()
+
     def a_star_multi_target(self, start, targets, visited):
+        cols = self.cols
+        cells = self.rows * cols
         start_x, start_y = start
-        heap = []
-        heapq.heappush(heap, (0, 0, start_x, start_y, []))
-        seen = set()
-        target_set = set(targets)
+        start_id = start_y * cols + start_x
+        best = array('q', [-1]) * cells
+        parent = array('q', [-1]) * cells
+        depth = array('q', [0]) * cells
+        closed = bytearray(cells)
+        order = {}
+        if not isinstance(targets, FrontierSet):
+            frontier = FrontierSet(self.rows, cols)
+            for target in targets:
+                frontier.add(target)
+            targets = frontier
+        target_bits = targets.bits
+        counts = self.visited.counts
+        best[start_id] = 0
+        queue = BucketQueue() if self.queue_type == 'bucket' else HeapQueue()
+        queue.push(0, (start_x, start_y))
 
-        while heap:
-            _, cost, x, y, path = heapq.heappop(heap)
+        while queue:
+            cost, (x, y) = queue.pop()
+            cell = y * cols + x
+            if closed[cell]:
+                continue
 
-            if (x, y) in target_set:
-                return path + [(x, y)]
+            if target_bits[cell >> 3] >> (cell & 7) & 1:
+                return self.rebuild_path(parent, cell) + [(x, y)]
+            closed[cell] = 1
+            self.expansions += 1
 
-            if (x, y) in seen:
-                continue
-            seen.add((x, y))
-
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.cols and 0 <= ny < self.rows:
-                    wall_key = ((x, y), (nx, ny)) if (x, y) < (nx, ny) else ((nx, ny), (x, y))
-                    if not self.known_walls.get(wall_key, False):
-                        visit_count = self.visited.get((nx, ny), 0)
-                        visit_penalty = visit_count * 2
-                        new_cost = cost + 1 + visit_penalty
-                        heapq.heappush(
-                            heap,
-                            (new_cost, new_cost, nx, ny, path + [(nx, ny)])
-                        )
+            for nx, ny in self.known_walls.open_neighbors(x, y):
+                neighbor = ny * cols + nx
+                if closed[neighbor]:
+                    continue
+                visit_count = counts[neighbor]
+                visit_penalty = visit_count * 2
+                new_cost = cost + 1 + visit_penalty
+                old_cost = best[neighbor]
+                if old_cost == -1 or new_cost < old_cost:
+                    best[neighbor] = new_cost
+                    parent[neighbor] = cell
+                    depth[neighbor] = depth[cell] + 1
+                    queue.push(new_cost, (nx, ny))
+                elif new_cost == old_cost and self.path_precedes(parent, depth, cell, parent[neighbor], neighbor, order):
+                    parent[neighbor] = cell
+                    depth[neighbor] = depth[cell] + 1
         return None
 
-    def get_required_turns(self, current_dir, target_dir):
-        current_idx = self.directions.index(current_dir)
-        target_idx = self.directions.index(target_dir)
-        diff = (target_idx - current_idx) % 4
-        if diff == 0:
-            return []
-        elif diff == 1:
-            return [self.directions[(current_idx + 1) % 4]]
-        elif diff == 3:
-            return [self.directions[(current_idx - 1) % 4]]
-        elif diff == 2:
-            return [self.directions[(current_idx + 1) % 4], self.directions[(current_idx + 2) % 4]]
+    def rebuild_path(self, parent, cell):
+        path = []
+        while parent[cell] != -1:
+            path.append((cell % self.cols, cell // self.cols))
+            cell = parent[cell]
+        path.reverse()
+        return path
+
+    def path_precedes(self, parent, depth, cell1, cell2, target, order):
+        # Equal-cost ties go to the lexicographically smaller cell sequence,
+        # so the chosen path matches a search that kept full path lists.
+        # Tied parents are never ancestors of each other, so every pair met
+        # on the way up to the common ancestor compares the same way and is
+        # remembered in order.
+        cells = len(parent)
+        pairs = []
+        step1 = step2 = target
+        while True:
+            key = cell1 * cells + cell2
+            result = order.get(key)
+            if result is not None:
+                break
+            pairs.append((cell1, cell2))
+            depth1 = depth[cell1]
+            depth2 = depth[cell2]
+            if depth1 >= depth2:
+                step1, cell1 = cell1, parent[cell1]
+            if depth2 >= depth1:
+                step2, cell2 = cell2, parent[cell2]
+            if cell1 == cell2:
+                result = (step1 % self.cols, step1 // self.cols) < (step2 % self.cols, step2 // self.cols)
+                break
+        for cell1, cell2 in pairs:
+            order[cell1 * cells + cell2] = result
+            order[cell2 * cells + cell1] = not result
+        return result
+
+    def turn_codes(self, current_dir, target_dir):
+        diff = (target_dir - current_dir) % 4
+        if diff == 1:
+            return [(current_dir + 1) % 4]
+        if diff == 3:
+            return [(current_dir - 1) % 4]
+        if diff == 2:
+            return [(current_dir + 1) % 4, (current_dir + 2) % 4]
         return []
 
-    def get_next_step(self):
-        if not self.scanned_cells:
-            self.scan_environment(self.current_pos)
+    def get_required_turns(self, current_dir, target_dir):
+        turns = self.turn_codes(DIRECTION_CODES[current_dir], DIRECTION_CODES[target_dir])
+        return [DIRECTIONS[turn] for turn in turns]
 
-        if not self.scanned_cells:
-            return None
+    def get_next_step(self):
+        while True:
+            if not self.scanned_cells:
+                self.scan_environment(self.current_pos)
 
-        if self.path_index >= len(self.path) or not self.path:
-            self.initialize_path()
-            self.path_index = 0
-            if not self.path:
+            if not self.scanned_cells:
                 return None
 
-        x, y, direction = self.path[self.path_index]
-        self.path_index += 1
-
-        wall_key = ((self.current_pos[0], self.current_pos[1]), (x, y)) if (self.current_pos[0], self.current_pos[1]) < (x, y) else ((x, y), (self.current_pos[0], self.current_pos[1]))
-        if self.walls.get(wall_key, False):
-            self.initialize_path()
-            self.path_index = 0
-            return self.get_next_step()
-
-        if (x, y) != self.current_pos:
-            target_dir = direction
-            if x > self.current_pos[0]:
-                target_dir = 'EAST'
-            elif x < self.current_pos[0]:
-                target_dir = 'WEST'
-            elif y > self.current_pos[1]:
-                target_dir = 'SOUTH'
-            elif y < self.current_pos[1]:
-                target_dir = 'NORTH'
+            if self.path_index >= len(self.path) or not self.path:
+                self.initialize_path()
+                self.path_index = 0
+                if not self.path:
+                    return None
+
+            x, y, direction = self.path[self.path_index]
+            self.path_index += 1
+            if (x, y) == self.current_pos:
+                return (x, y, self.current_dir)
+
+            cx, cy = self.current_pos
+            move_dir = direction_between(self.current_pos, (x, y))
+            if self.walls.has_wall(cx, cy, move_dir):
+                self.learn_wall(cx, cy, move_dir, True)
+                self.update_frontier((x, y))
+                self.initialize_path()
+                self.path_index = 0
+                continue
+
+            target_dir = self.directions[move_dir]
             if target_dir != self.current_dir:
                 turns = self.get_required_turns(self.current_dir, target_dir)
                 if turns:
                     self.current_dir = turns[0]
                     self.path_index -= 1
-                    return (self.current_pos[0], self.current_pos[1], self.current_dir)
+                    return (cx, cy, self.current_dir)
             self.current_pos = (x, y)
-            self.visited[(x, y)] = self.visited.get((x, y), 0) + 1
-            self.scanned_cells.discard((x, y))
+            self.visit((x, y))
+            self.remove_frontier((x, y))
             self.scan_environment((x, y))
-        return (x, y, self.current_dir)
\ No newline at end of file
+            return (x, y, self.current_dir)
+
+    def steps(self):
+        step = self.get_next_step()
+        while step:
+            x, y, direction = step
+            yield x, y, DIRECTION_CODES[direction]
+            step = self.get_next_step()
+
+    def step_chunks(self, size=4096):
+        chunk = array('i')
+        for step in self.steps():
+            chunk.extend(step)
+            if len(chunk) >= size * 3:
+                yield chunk
+                chunk = array('i')
+        if chunk:
+            yield chunk
\ No newline at end of file
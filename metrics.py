@@ -0,0 +1,102 @@
+import csv
+import json
+import os
+import sys
+from array import array
+from collections import Counter
+from cell_state import VisitCounts
+
+CURVE_POINTS = 500
+RESULTS_FILE = "metrics.jsonl"
+
+def visit_histogram(visited):
+    if isinstance(visited, VisitCounts):
+        data = visited.counts.tobytes()
+        if sys.byteorder == "little":
+            low, high = data[0::2], data[1::2]
+        else:
+            low, high = data[1::2], data[0::2]
+        if high.count(0) == len(high):
+            histogram = {}
+            remaining = len(visited)
+            visits = 1
+            while remaining > 0 and visits < 256:
+                count = low.count(visits)
+                if count:
+                    histogram[visits] = count
+                    remaining -= count
+                visits += 1
+            return histogram
+        histogram = Counter(visited.counts)
+        histogram.pop(0, None)
+    else:
+        histogram = Counter(visited.values())
+    return dict(sorted(histogram.items()))
+
+def summary(visited, rows, cols, steps, turns):
+    histogram = visit_histogram(visited)
+    area = sum(histogram.values())
+    total_visits = sum(visits * count for visits, count in histogram.items())
+    return {
+        "cells": rows * cols,
+        "area": area,
+        "coverage": area / (rows * cols) if rows * cols else 0,
+        "visits": histogram,
+        "total_visits": total_visits,
+        "avg_visits": total_visits / area if area else 0,
+        "revisit_ratio": (total_visits - area) / total_visits if total_visits else 0,
+        "steps": steps,
+        "turns": turns,
+        "steps_per_cell": steps / area if area else 0,
+        "turns_per_cell": turns / area if area else 0,
+    }
+
+class RunCurves:
+    def __init__(self, cells, points=CURVE_POINTS):
+        self.cells = cells
+        self.stride = max(1, 2 * cells // points)
+        self.next_sample = 0
+        self.steps = array('i')
+        self.area = array('i')
+        self.frontier = array('i')
+
+    def sample(self, steps, area, frontier):
+        if steps < self.next_sample:
+            return
+        self.steps.append(steps)
+        self.area.append(area)
+        self.frontier.append(frontier)
+        self.next_sample = steps + self.stride
+
+    def finish(self, steps, area, frontier):
+        if not self.steps or self.steps[-1] != steps:
+            self.steps.append(steps)
+            self.area.append(area)
+            self.frontier.append(frontier)
+
+    def to_dict(self):
+        cells = self.cells or 1
+        return {
+            "steps": self.steps.tolist(),
+            "coverage": [round(area / cells, 4) for area in self.area],
+            "frontier": self.frontier.tolist(),
+        }
+
+def record_row(record, fields):
+    row = {}
+    for field in fields:
+        value = record.get(field)
+        row[field] = json.dumps(value) if isinstance(value, (dict, list)) else value
+    return row
+
+def write_record(filename, record, fields=None):
+    new_file = not os.path.exists(filename) or os.path.getsize(filename) == 0
+    with open(filename, "a", newline="", encoding="utf-8") as f:
+        if filename.endswith(".csv"):
+            fields = fields or list(record)
+            writer = csv.DictWriter(f, fieldnames=fields)
+            if new_file:
+                writer.writeheader()
+            writer.writerow(record_row(record, fields))
+        else:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
\ No newline at end of file
@@ -0,0 +1,64 @@
+from array import array
+from bisect import bisect_right
+from wall_grid import OFFSETS
+
+TURN = 4
+
+class Plan:
+    def __init__(self):
+        self.xs = array('i')
+        self.ys = array('i')
+        self.codes = array('b')
+        self.ends = array('i')
+        self.segment = 0
+
+    def turn(self, x, y, direction):
+        self.xs.append(x)
+        self.ys.append(y)
+        self.codes.append(TURN + direction)
+        self.ends.append(len(self) + 1)
+
+    def move(self, x, y, direction):
+        if self.codes and self.codes[-1] == direction:
+            self.ends[-1] += 1
+            return
+        self.xs.append(x)
+        self.ys.append(y)
+        self.codes.append(direction)
+        self.ends.append(len(self) + 1)
+
+    def locate(self, index):
+        ends = self.ends
+        segment = self.segment
+        if segment < len(ends) and ends[segment] > index and (segment == 0 or ends[segment - 1] <= index):
+            return segment
+        segment = bisect_right(ends, index)
+        self.segment = segment
+        return segment
+
+    def __len__(self):
+        return self.ends[-1] if self.ends else 0
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("plan index out of range")
+        segment = self.locate(index)
+        code = self.codes[segment]
+        if code >= TURN:
+            return self.xs[segment], self.ys[segment], code - TURN
+        offset = index - (self.ends[segment - 1] if segment else 0) + 1
+        dx, dy = OFFSETS[code]
+        return self.xs[segment] + dx * offset, self.ys[segment] + dy * offset, code
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def segments(self):
+        start = 0
+        for segment, end in enumerate(self.ends):
+            code = self.codes[segment]
+            yield self.xs[segment], self.ys[segment], code % TURN, end - start, code >= TURN
+            start = end
\ No newline at end of file
@@ -0,0 +1,372 @@
+import tkinter as tk
+from wall_grid import DIRECTIONS, OFFSETS, NORTH, EAST, SOUTH, WEST
+
+VISIT_COLORS = {1: "#00FF00", 2: "#FFA500", 3: "#800080"}
+BITMAP_CELLS = 40000
+MAX_CELL_SIZE = 100
+
+class CanvasRenderer:
+    def __init__(self, canvas, field):
+        self.canvas = canvas
+        self.field = field
+        self.offset_x = 0
+        self.offset_y = 0
+        self.view = (0, 0, 0, 0)
+        self.view_fixed = False
+        self.cell_items = {}
+        self.text_items = {}
+        self.wall_items = {}
+        self.free_items = {"rectangle": [], "text": [], "line": []}
+        self.anchors = {}
+        self.border_item = None
+        self.robot_item = None
+        self.dirty_cells = set()
+        self.dirty_walls = set()
+        self.robot_dirty = False
+
+    def cell_color(self, x, y):
+        field = self.field
+        visit_count = field.visited.get((x, y), 0)
+        if (x, y) == field.robot_pos:
+            return "blue"
+        if (x, y) in field.scanned_cells and visit_count == 0:
+            return "yellow"
+        if visit_count > 0:
+            return VISIT_COLORS.get(visit_count, "#FF0000")
+        return "white"
+
+    def cell_at(self, px, py):
+        size = self.field.cell_size
+        return int((px - self.offset_x) // size), int((py - self.offset_y) // size)
+
+    def visible(self, x, y):
+        x0, y0, x1, y1 = self.view
+        return x0 <= x < x1 and y0 <= y < y1
+
+    def visible_range(self):
+        field = self.field
+        size = field.cell_size
+        x0 = max(0, -self.offset_x // size)
+        y0 = max(0, -self.offset_y // size)
+        x1 = min(field.cols, (self.canvas.winfo_width() - self.offset_x) // size + 1)
+        y1 = min(field.rows, (self.canvas.winfo_height() - self.offset_y) // size + 1)
+        return x0, y0, max(x0, x1), max(y0, y1)
+
+    def center_view(self):
+        field_width = self.field.cols * self.field.cell_size
+        field_height = self.field.rows * self.field.cell_size
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+        self.offset_x = (canvas_width - field_width) // 2 if canvas_width > field_width else 0
+        self.offset_y = (canvas_height - field_height) // 2 if canvas_height > field_height else 0
+
+    def reset_view(self):
+        self.view_fixed = False
+
+    def pan(self, dx, dy):
+        self.offset_x += dx
+        self.offset_y += dy
+        self.view_fixed = True
+        self.canvas.move("all", dx, dy)
+        if self.visible_range() != self.view:
+            self.sync_view(False)
+
+    def zoom_at(self, px, py, size):
+        old_size = self.field.cell_size
+        self.offset_x = px - (px - self.offset_x) * size // old_size
+        self.offset_y = py - (py - self.offset_y) * size // old_size
+        self.field.cell_size = size
+        self.view_fixed = True
+        self.sync_view(True)
+
+    def follow(self):
+        field = self.field
+        size = field.cell_size
+        x, y = field.robot_pos
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        center_x = self.offset_x + x * size + size // 2
+        center_y = self.offset_y + y * size + size // 2
+        moved = False
+        if field.cols * size > width and not width // 4 <= center_x <= width * 3 // 4:
+            self.offset_x = width // 2 - x * size - size // 2
+            moved = True
+        if field.rows * size > height and not height // 4 <= center_y <= height * 3 // 4:
+            self.offset_y = height // 2 - y * size - size // 2
+            moved = True
+        if moved:
+            self.view_fixed = True
+        return moved
+
+    def mark_cell(self, x, y):
+        self.dirty_cells.add((x, y))
+
+    def mark_wall(self, wall_key):
+        self.dirty_walls.add(wall_key)
+
+    def mark_robot(self):
+        self.robot_dirty = True
+
+    def acquire(self, kind, coords, **options):
+        pool = self.free_items[kind]
+        if pool:
+            item = pool.pop()
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfig(item, state="normal", **options)
+            return item
+        item = getattr(self.canvas, "create_" + kind)(*coords, tags=kind, **options)
+        self.canvas.tag_lower(item, self.anchors[kind])
+        return item
+
+    def release(self, kind, item):
+        self.canvas.itemconfig(item, state="hidden")
+        self.free_items[kind].append(item)
+
+    def rebuild(self):
+        self.canvas.delete("all")
+        self.cell_items.clear()
+        self.text_items.clear()
+        self.wall_items.clear()
+        for pool in self.free_items.values():
+            pool.clear()
+        self.dirty_cells.clear()
+        self.dirty_walls.clear()
+        if not self.view_fixed:
+            self.center_view()
+        self.view = (0, 0, 0, 0)
+        # Hidden markers fix the z-order once: new items are slipped in just
+        # below the marker of the layer above, so nothing is re-raised later.
+        text_anchor = self.canvas.create_line(0, 0, 0, 0, state="hidden")
+        line_anchor = self.canvas.create_line(0, 0, 0, 0, state="hidden")
+        self.border_item = self.canvas.create_rectangle(0, 0, 0, 0, outline="black", width=3)
+        self.robot_item = self.canvas.create_polygon(self.robot_points(), fill="white", outline="black")
+        self.anchors = {"rectangle": text_anchor, "text": line_anchor, "line": self.border_item}
+        self.sync_view(True)
+
+    def sync_view(self, reposition):
+        self.view = self.visible_range()
+        for cell in [cell for cell in self.cell_items if not self.visible(*cell)]:
+            self.release("rectangle", self.cell_items.pop(cell))
+            if cell in self.text_items:
+                self.release("text", self.text_items.pop(cell))
+        for wall_key in [key for key in self.wall_items if not (self.visible(*key[0]) or self.visible(*key[1]))]:
+            self.release("line", self.wall_items.pop(wall_key))
+        x0, y0, x1, y1 = self.view
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                if reposition or (x, y) not in self.cell_items:
+                    self.update_cell(x, y)
+                    self.update_wall(((x, y), (x + 1, y)))
+                    self.update_wall(((x, y), (x, y + 1)))
+                    if x == x0:
+                        self.update_wall(((x - 1, y), (x, y)))
+                    if y == y0:
+                        self.update_wall(((x, y - 1), (x, y)))
+        size = self.field.cell_size
+        self.canvas.coords(
+            self.border_item, self.offset_x, self.offset_y,
+            self.offset_x + self.field.cols * size, self.offset_y + self.field.rows * size
+        )
+        self.canvas.coords(self.robot_item, *self.robot_points())
+        self.robot_dirty = False
+
+    def flush(self):
+        if self.robot_dirty and self.field.follow_robot and self.follow():
+            self.sync_view(True)
+        for x, y in self.dirty_cells:
+            self.update_cell(x, y)
+        self.dirty_cells.clear()
+        for wall_key in self.dirty_walls:
+            self.update_wall(wall_key)
+        self.dirty_walls.clear()
+        if self.robot_dirty:
+            self.canvas.coords(self.robot_item, *self.robot_points())
+            self.robot_dirty = False
+
+    def update_cell(self, x, y):
+        if not self.visible(x, y):
+            return
+        field = self.field
+        size = field.cell_size
+        left = self.offset_x + x * size
+        top = self.offset_y + y * size
+        visit_count = field.visited.get((x, y), 0)
+        color = self.cell_color(x, y)
+        item = self.cell_items.get((x, y))
+        if item is None:
+            self.cell_items[(x, y)] = self.acquire("rectangle", (left, top, left + size, top + size), fill=color, outline="gray")
+        else:
+            self.canvas.coords(item, left, top, left + size, top + size)
+            self.canvas.itemconfig(item, fill=color)
+        item = self.text_items.get((x, y))
+        if visit_count > 0 and (x, y) != field.robot_pos:
+            text_color = "black" if visit_count <= 2 else "white"
+            center = (left + size // 2, top + size // 2)
+            if item is None:
+                self.text_items[(x, y)] = self.acquire("text", center, text=str(visit_count), fill=text_color)
+            else:
+                self.canvas.coords(item, *center)
+                self.canvas.itemconfig(item, text=str(visit_count), fill=text_color)
+        elif item is not None:
+            self.release("text", self.text_items.pop((x, y)))
+
+    def update_wall(self, wall_key):
+        field = self.field
+        size = field.cell_size
+        item = self.wall_items.get(wall_key)
+        if not field.walls.get(wall_key, False) or not (self.visible(*wall_key[0]) or self.visible(*wall_key[1])):
+            if item is not None:
+                self.release("line", self.wall_items.pop(wall_key))
+            return
+        (x1, y1), (x2, y2) = wall_key
+        if x1 == x2:
+            y = max(y1, y2)
+            coords = (self.offset_x + x1 * size, self.offset_y + y * size,
+                      self.offset_x + (x1 + 1) * size, self.offset_y + y * size)
+        else:
+            x = max(x1, x2)
+            coords = (self.offset_x + x * size, self.offset_y + y1 * size,
+                      self.offset_x + x * size, self.offset_y + (y1 + 1) * size)
+        if item is None:
+            self.wall_items[wall_key] = self.acquire("line", coords, width=3, fill="black")
+        else:
+            self.canvas.coords(item, *coords)
+
+    def robot_points(self):
+        field = self.field
+        x, y = field.robot_pos
+        size = field.cell_size
+        left = self.offset_x + x * size
+        top = self.offset_y + y * size
+        half = size // 2
+        quarter = size // 4
+        if field.robot_dir == 'NORTH':
+            return [left + half, top + quarter, left + quarter, top + 3 * quarter, left + 3 * quarter, top + 3 * quarter]
+        if field.robot_dir == 'EAST':
+            return [left + 3 * quarter, top + half, left + quarter, top + quarter, left + quarter, top + 3 * quarter]
+        if field.robot_dir == 'SOUTH':
+            return [left + half, top + 3 * quarter, left + quarter, top + quarter, left + 3 * quarter, top + quarter]
+        return [left + quarter, top + half, left + 3 * quarter, top + quarter, left + 3 * quarter, top + 3 * quarter]
+
+class BitmapRenderer(CanvasRenderer):
+    def __init__(self, canvas, field):
+        super().__init__(canvas, field)
+        self.image = None
+        self.image_item = None
+        self.robot_cell = None
+
+    def mark_wall(self, wall_key):
+        for x, y in wall_key:
+            self.dirty_cells.add((x, y))
+
+    def block(self, x, y):
+        field = self.field
+        size = field.cell_size
+        color = self.cell_color(x, y)
+        pixels = [[color] * size for _ in range(size)]
+        if size >= 3:
+            walls = field.walls
+            if walls.has_wall(x, y, NORTH):
+                pixels[0] = ["black"] * size
+            if walls.has_wall(x, y, SOUTH):
+                pixels[-1] = ["black"] * size
+            if walls.has_wall(x, y, WEST):
+                for row in pixels:
+                    row[0] = "black"
+            if walls.has_wall(x, y, EAST):
+                for row in pixels:
+                    row[-1] = "black"
+        if (x, y) == field.robot_pos and size >= 5:
+            dx, dy = OFFSETS[DIRECTIONS.index(field.robot_dir)]
+            center = size // 2
+            for i in range(size // 2 - 1):
+                pixels[center + dy * i][center + dx * i] = "white"
+        return pixels
+
+    def rebuild(self):
+        self.canvas.delete("all")
+        self.dirty_cells.clear()
+        self.dirty_walls.clear()
+        if not self.view_fixed:
+            self.center_view()
+        self.image_item = None
+        self.sync_view(True)
+
+    def sync_view(self, reposition):
+        size = self.field.cell_size
+        old_image = self.image
+        ox0, oy0, ox1, oy1 = self.view
+        self.view = x0, y0, x1, y1 = self.visible_range()
+        if reposition or old_image is None or self.image_item is None:
+            self.image = tk.PhotoImage(master=self.canvas, width=max(1, (x1 - x0) * size), height=max(1, (y1 - y0) * size))
+            self.paint(x0, y0, x1, y1)
+            self.robot_cell = self.field.robot_pos
+            self.robot_dirty = False
+        elif self.view != (ox0, oy0, ox1, oy1):
+            # Panning keeps the pixels that stay in view and paints only the
+            # strips of cells that scroll in.
+            self.image = tk.PhotoImage(master=self.canvas, width=max(1, (x1 - x0) * size), height=max(1, (y1 - y0) * size))
+            cx0, cy0 = max(x0, ox0), max(y0, oy0)
+            cx1, cy1 = min(x1, ox1), min(y1, oy1)
+            if cx0 < cx1 and cy0 < cy1:
+                self.image.tk.call(
+                    self.image, "copy", old_image,
+                    "-from", (cx0 - ox0) * size, (cy0 - oy0) * size, (cx1 - ox0) * size, (cy1 - oy0) * size,
+                    "-to", (cx0 - x0) * size, (cy0 - y0) * size
+                )
+                self.paint(x0, y0, x1, cy0)
+                self.paint(x0, cy1, x1, y1)
+                self.paint(x0, cy0, cx0, cy1)
+                self.paint(cx1, cy0, x1, cy1)
+            else:
+                self.paint(x0, y0, x1, y1)
+        left = self.offset_x + x0 * size
+        top = self.offset_y + y0 * size
+        if self.image_item is None:
+            self.image_item = self.canvas.create_image(left, top, image=self.image, anchor=tk.NW)
+        else:
+            self.canvas.coords(self.image_item, left, top)
+            self.canvas.itemconfig(self.image_item, image=self.image)
+
+    def paint(self, x0, y0, x1, y1):
+        if x0 >= x1 or y0 >= y1:
+            return
+        size = self.field.cell_size
+        lines = []
+        for y in range(y0, y1):
+            blocks = [self.block(x, y) for x in range(x0, x1)]
+            for dy in range(size):
+                line = []
+                for pixels in blocks:
+                    line.extend(pixels[dy])
+                lines.append("{" + " ".join(line) + "}")
+        self.image.put(" ".join(lines), to=((x0 - self.view[0]) * size, (y0 - self.view[1]) * size))
+
+    def flush(self):
+        if self.robot_dirty:
+            if self.field.follow_robot and self.follow():
+                self.sync_view(False)
+            self.dirty_cells.add(self.robot_cell)
+            self.dirty_cells.add(self.field.robot_pos)
+            self.robot_cell = self.field.robot_pos
+            self.robot_dirty = False
+        for x, y in self.dirty_cells:
+            self.update_cell(x, y)
+        self.dirty_cells.clear()
+
+    def update_cell(self, x, y):
+        if not self.visible(x, y):
+            return
+        size = self.field.cell_size
+        x0, y0, _, _ = self.view
+        data = " ".join("{" + " ".join(row) + "}" for row in self.block(x, y))
+        self.image.put(data, to=((x - x0) * size, (y - y0) * size))
+
+def min_cell_size(rows, cols):
+    return 1 if rows * cols > BITMAP_CELLS else 5
+
+def make_renderer(canvas, field, renderer=None):
+    kind = BitmapRenderer if field.rows * field.cols > BITMAP_CELLS else CanvasRenderer
+    if type(renderer) is kind:
+        return renderer
+    return kind(canvas, field)
\ No newline at end of file
@@ -0,0 +1,64 @@
+import queue
+import threading
+
+class StepStream:
+    def __init__(self, solver, size=64):
+        self.solver = solver
+        self.steps = queue.Queue(size)
+        self.held = []
+        self.cancelled = threading.Event()
+        self.thread = None
+        self.done = False
+
+    def start(self):
+        if self.done:
+            return
+        if self.thread and self.thread.is_alive():
+            if not self.cancelled.is_set():
+                return
+            self.thread.join()
+        self.cancelled.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while not self.cancelled.is_set():
+            step = self.held.pop() if self.held else self.solver.get_next_step()
+            while True:
+                try:
+                    self.steps.put(step, timeout=0.05)
+                    break
+                except queue.Full:
+                    if self.cancelled.is_set():
+                        self.held.append(step)
+                        return
+            if step is None:
+                self.done = True
+                return
+
+    def get_nowait(self):
+        return self.steps.get_nowait()
+
+    def stop(self, wait=False):
+        self.cancelled.set()
+        if wait and self.thread:
+            self.thread.join()
+
+    def take_queued(self, steps):
+        while True:
+            try:
+                steps.append(self.steps.get_nowait())
+            except queue.Empty:
+                return steps
+
+    def drain(self):
+        # Emptying the queue first lets a worker blocked on a full queue
+        # finish its put and see the cancel at once.
+        self.stop()
+        steps = self.take_queued([])
+        if self.thread:
+            self.thread.join()
+        self.take_queued(steps)
+        steps.extend(self.held)
+        self.held = []
+        return [step for step in steps if step is not None]
\ No newline at end of file
@@ -0,0 +1,184 @@
+import struct
+
+NORTH, EAST, SOUTH, WEST = 0, 1, 2, 3
+DIRECTIONS = ['NORTH', 'EAST', 'SOUTH', 'WEST']
+OFFSETS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+OPPOSITE = [SOUTH, WEST, NORTH, EAST]
+EAST_PLANE = bytes(mask >> EAST & 1 for mask in range(256))
+SOUTH_PLANE = bytes(mask >> SOUTH & 1 for mask in range(256))
+
+class WallGrid:
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.cells = bytearray(rows * cols)
+        self.close_border()
+
+    def close_border(self):
+        cells = self.cols * self.rows
+        for x in range(self.cols):
+            self.cells[x] |= 1 << NORTH
+            self.cells[cells - self.cols + x] |= 1 << SOUTH
+        for y in range(self.rows):
+            self.cells[y * self.cols] |= 1 << WEST
+            self.cells[y * self.cols + self.cols - 1] |= 1 << EAST
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.cols and 0 <= y < self.rows
+
+    def has_wall(self, x, y, direction):
+        return self.cells[y * self.cols + x] >> direction & 1 == 1
+
+    def set_wall(self, x, y, direction, state=True):
+        dx, dy = OFFSETS[direction]
+        nx, ny = x + dx, y + dy
+        if not self.in_bounds(nx, ny):
+            return
+        opposite = OPPOSITE[direction]
+        if state:
+            self.cells[y * self.cols + x] |= 1 << direction
+            self.cells[ny * self.cols + nx] |= 1 << opposite
+        else:
+            self.cells[y * self.cols + x] &= ~(1 << direction) & 0xF
+            self.cells[ny * self.cols + nx] &= ~(1 << opposite) & 0xF
+
+    def toggle_wall(self, x, y, direction):
+        state = not self.has_wall(x, y, direction)
+        self.set_wall(x, y, direction, state)
+        return state
+
+    def wall_count(self, x, y):
+        mask = self.cells[y * self.cols + x]
+        return (mask & 1) + (mask >> 1 & 1) + (mask >> 2 & 1) + (mask >> 3 & 1)
+
+    def open_neighbors(self, x, y):
+        mask = self.cells[y * self.cols + x]
+        neighbors = []
+        for direction in range(4):
+            if not mask >> direction & 1:
+                dx, dy = OFFSETS[direction]
+                neighbors.append((x + dx, y + dy))
+        return neighbors
+
+    def neighbor_ids(self, cell):
+        mask = self.cells[cell]
+        neighbors = []
+        if not mask & 1:
+            neighbors.append(cell - self.cols)
+        if not mask & 2:
+            neighbors.append(cell + 1)
+        if not mask & 4:
+            neighbors.append(cell + self.cols)
+        if not mask & 8:
+            neighbors.append(cell - 1)
+        return neighbors
+
+    def copy(self):
+        grid = WallGrid.__new__(WallGrid)
+        grid.rows = self.rows
+        grid.cols = self.cols
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    def edge(self, cell1, cell2):
+        (x1, y1), (x2, y2) = (cell1, cell2) if cell1 < cell2 else (cell2, cell1)
+        if not (self.in_bounds(x1, y1) and self.in_bounds(x2, y2)):
+            return None
+        if x1 == x2 and y2 == y1 + 1:
+            return x1, y1, SOUTH
+        if y1 == y2 and x2 == x1 + 1:
+            return x1, y1, EAST
+        return None
+
+    def get(self, key, default=False):
+        edge = self.edge(*key)
+        if edge is None:
+            return default
+        return self.has_wall(*edge)
+
+    def __getitem__(self, key):
+        edge = self.edge(*key)
+        if edge is None:
+            raise KeyError(key)
+        return self.has_wall(*edge)
+
+    def __setitem__(self, key, state):
+        edge = self.edge(*key)
+        if edge is None:
+            raise KeyError(key)
+        self.set_wall(*edge, bool(state))
+
+    def __iter__(self):
+        for key, _ in self.items():
+            yield key
+
+    def items(self):
+        cols = self.cols
+        for y in range(self.rows):
+            for x in range(cols):
+                mask = self.cells[y * cols + x]
+                if mask & (1 << EAST) and x < cols - 1:
+                    yield ((x, y), (x + 1, y)), True
+                if mask & (1 << SOUTH) and y < self.rows - 1:
+                    yield ((x, y), (x, y + 1)), True
+
+    def to_dict(self):
+        walls = {}
+        for y in range(self.rows):
+            for x in range(self.cols):
+                if x < self.cols - 1:
+                    walls[((x, y), (x + 1, y))] = self.has_wall(x, y, EAST)
+                if y < self.rows - 1:
+                    walls[((x, y), (x, y + 1))] = self.has_wall(x, y, SOUTH)
+        return walls
+
+    def to_bytes(self):
+        return struct.pack('<II', self.rows, self.cols) + bytes(self.cells)
+
+    @classmethod
+    def from_bytes(cls, data):
+        rows, cols = struct.unpack_from('<II', data)
+        if len(data) != 8 + rows * cols:
+            raise ValueError("wall grid data has the wrong length")
+        grid = cls.__new__(cls)
+        grid.rows = rows
+        grid.cols = cols
+        grid.cells = bytearray(data[8:])
+        return grid
+
+    def planes(self):
+        cells = bytes(self.cells)
+        return cells.translate(EAST_PLANE), cells.translate(SOUTH_PLANE)
+
+    @classmethod
+    def from_planes(cls, rows, cols, east, south):
+        size = rows * cols
+        east = int.from_bytes(east, 'little')
+        south = int.from_bytes(south, 'little')
+        masks = south << 8 * cols | east << 1 | south << 2 | east << 8 + 3
+        grid = cls.__new__(cls)
+        grid.rows = rows
+        grid.cols = cols
+        grid.cells = bytearray(masks.to_bytes(size + cols + 1, 'little')[:size])
+        grid.close_border()
+        return grid
+
+    @classmethod
+    def from_dict(cls, walls, rows, cols):
+        grid = cls(rows, cols)
+        for key, state in walls.items():
+            edge = grid.edge(*key)
+            if edge is not None and state:
+                grid.set_wall(*edge)
+        return grid
+
+def direction_between(cell1, cell2):
+    dx = cell2[0] - cell1[0]
+    dy = cell2[1] - cell1[1]
+    if dx > 0:
+        return EAST
+    if dx < 0:
+        return WEST
+    if dy > 0:
+        return SOUTH
+    return NORTH
\ No newline at end of file